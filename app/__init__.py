@@ -4,7 +4,7 @@ Creates and configures the Flask application instance.
 """
 
 import os
-from flask import Flask
+from flask import Flask, g
 
 # Load environment variables from .env file in development
 if os.environ.get('FLASK_ENV') != 'production':
@@ -58,6 +58,9 @@ def create_app(config_name=None):
     # CLI commands
     register_commands(app)
     
+    # Per-request hooks
+    register_request_hooks(app)
+    
     return app
 
 
@@ -89,6 +92,15 @@ def register_error_handlers(app):
         }, 500
 
 
+def register_request_hooks(app):
+    """Register hooks that run around each request."""
+    
+    @app.teardown_request
+    def clear_request_memos(error):
+        # g outlives the request when an outer app context is already pushed
+        g.pop('_verified_cache', None)
+
+
 def register_commands(app):
     """Register CLI commands for the application."""
     
@@ -7,7 +7,7 @@ Admin status changes are managed via manual database operations.
 from flask_jwt_extended import get_jwt_identity
 from pydantic import ValidationError
 from app.services import UserService
-from app.schemas.user_schema import UserResponseSchema
+from app.schemas.user_schema import UserResponseSchema, USER_LIST_ADAPTER
 from app.utils import (
     success_response, validation_error_response,
     not_found_response, unauthorized_response, internal_error_response,
@@ -55,10 +55,9 @@ def get_all_admins_controller():
         user_service = UserService()
         admins = user_service.get_all_admins()
 
-        admin_list = []
-        for admin in admins:
-            admin_data = UserResponseSchema.model_validate(admin).model_dump()
-            admin_list.append(admin_data)
+        admin_list = USER_LIST_ADAPTER.dump_python(
+            USER_LIST_ADAPTER.validate_python(admins)
+        )
 
         return success_response(
             message="Admin users retrieved successfully",
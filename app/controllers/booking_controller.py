@@ -1,4 +1,5 @@
 from datetime import date, datetime
+from flask import current_app
 from pydantic import ValidationError
 from app.models import Booking, User
 from app.extensions import db
@@ -84,7 +85,7 @@ def create_booking_controller(data, current_user_id):
 
         return success_response(
             message="Booking created successfully",
-            data=BookingOut.from_orm(booking).dict(),
+            data=BookingOut.model_validate(booking).model_dump(),
             status_code=201
         )
 
@@ -94,10 +95,10 @@ def create_booking_controller(data, current_user_id):
         return internal_error_response()
 
 
-def get_all_bookings_controller(current_user_id):
+def get_all_bookings_controller(current_user_id, page=None, per_page=None):
     """
     Controller to get bookings based on user role:
-    - Admin users: Get all bookings from all users
+    - Admin users: Get all bookings from all users, paginated
     - Regular users: Get only their own bookings
     """
     try:
@@ -113,8 +114,11 @@ def get_all_bookings_controller(current_user_id):
         
         # Check if user has admin privileges
         if user.is_admin:
-            # Admin can see all bookings
-            bookings = BookingService.get_all_bookings()
+            # Admin can see all bookings, one page at a time (first page by default)
+            page = max(page or 1, 1)
+            per_page = min(max(per_page or current_app.config['ITEMS_PER_PAGE'], 1),
+                           current_app.config['MAX_ITEMS_PER_PAGE'])
+            bookings = BookingService.get_all_bookings(page, per_page)
             message = "All bookings retrieved successfully"
         else:
             # Regular user can only see their own bookings
@@ -171,7 +175,7 @@ def get_booking_controller(booking_id, current_user_id):
 
         return success_response(
             message="Booking retrieved successfully",
-            data=BookingOut.from_orm(booking).dict()
+            data=BookingOut.model_validate(booking).model_dump()
         )
 
     except Exception as e:
@@ -289,7 +293,7 @@ def update_booking_controller(booking_id, data, current_user_id):
 
         return success_response(
             message="Booking status updated successfully",
-            data=BookingOut.from_orm(updated_booking).dict()
+            data=BookingOut.model_validate(updated_booking).model_dump()
         )
 
     except Exception as e:
@@ -369,7 +373,7 @@ def cancel_booking_controller(booking_id, current_user_id):
             'refund_amount': float(cancelled_booking.total_price) if current_status == 'PENDING' else 0.0
         }
         
-        response_data = BookingOut.from_orm(cancelled_booking).dict()
+        response_data = BookingOut.model_validate(cancelled_booking).model_dump()
         response_data['refund_info'] = refund_info
         
         return success_response(
@@ -514,7 +518,7 @@ def get_bookings_by_status_controller(status, current_user_id):
             return error_response(f"Invalid status '{status}'. Valid statuses are: {[s.value for s in BookingStatus]}", 400)
 
         bookings = BookingService.get_bookings_by_status(status_enum)
-        booking_data = [BookingOut.from_orm(b).dict() for b in bookings]
+        booking_data = [BookingOut.model_validate(dict(b)).model_dump() for b in bookings]
 
         return success_response(
             message=f"Bookings with status '{status}' retrieved successfully",
@@ -526,7 +530,7 @@ def get_bookings_by_status_controller(status, current_user_id):
         return internal_error_response()
 
 
-def get_booking_history_controller(current_user_id, limit=20):
+def get_booking_history_controller(current_user_id, limit=20, before_id=None):
     """Handle getting booking history for current user."""
     try:
         # Convert JWT identity to int
@@ -536,7 +540,7 @@ def get_booking_history_controller(current_user_id, limit=20):
 
         booking_service = BookingService()
         try:
-            bookings = booking_service.get_booking_history(current_user_id, limit)
+            bookings = booking_service.get_booking_history(current_user_id, limit, before_id)
         except ValueError as ve:
             error_msg = str(ve)
             if "Email verification required" in error_msg:
@@ -549,7 +553,7 @@ def get_booking_history_controller(current_user_id, limit=20):
             else:
                 return error_response(error_msg, 400)
 
-        booking_data = [BookingOut.from_orm(b).dict() for b in bookings]
+        booking_data = [BookingOut.model_validate(b).model_dump() for b in bookings]
 
         return success_response(
             message="Booking history retrieved successfully",
@@ -614,7 +618,7 @@ def get_bookings_by_item_controller(item_id, current_user_id):
             return unauthorized_response("Admin access required to view item booking history")
 
         bookings = BookingService.get_bookings_by_item(item_id)
-        booking_data = [BookingOut.from_orm(b).dict() for b in bookings]
+        booking_data = [BookingOut.model_validate(dict(b)).model_dump() for b in bookings]
 
         return success_response(
             message=f"Bookings for item {item_id} retrieved successfully",
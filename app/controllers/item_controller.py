@@ -7,9 +7,10 @@ from app import db
 
 item_service = ItemService()
 
-def list_items_controller():
+def list_items_controller(page=None, per_page=None):
     try:
-        items = item_service.get_available_items()
+        # The service defaults and clamps page/per_page
+        items = item_service.get_available_items(page, per_page)
         data = [item.to_dict() for item in items]
         return success_response('Items retrieved successfully', data)
     except Exception as e:
@@ -137,11 +138,9 @@ def update_item_controller(item_id, json_data):
 
 def delete_item_controller(item_id):
     try:
-        item = db.session.get(Item, item_id)
+        item = item_service.delete_item(item_id)
         if not item:
             return not_found_response('Item')
-        db.session.delete(item)
-        db.session.commit()
         return success_response('Item deleted successfully')
     except Exception as e:
         db.session.rollback()
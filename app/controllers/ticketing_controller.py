@@ -8,6 +8,8 @@ from app.services.ticketing_service import TicketingService
 from app.schemas.ticketing_schema import (
     CreateTicketRequest,
     AddMessageRequest,
+    TicketListResponse,
+    TICKET_LIST_ADAPTER,
 )
 from app.utils import (
     success_response,
@@ -168,6 +170,25 @@ def _serialize_ticket(ticket):
         }
 
 
+def _serialize_ticket_list(tickets):
+    """
+    Serialize a list of tickets into the ticket list response payload.
+
+    All rows are validated in one TypeAdapter call instead of one model
+    validation per ticket.
+
+    Args:
+        tickets: List of Ticket model instances
+
+    Returns:
+        Dictionary with serialized tickets and total count
+    """
+    return TicketListResponse.model_construct(
+        tickets=TICKET_LIST_ADAPTER.validate_python(tickets, from_attributes=True),
+        total_count=len(tickets)
+    ).model_dump()
+
+
 def _validate_id_parameter(id_value, id_name="ID"):
     """
     Validate ID parameters from URL.
@@ -440,11 +461,7 @@ def get_user_tickets_controller(user_id, current_user_id):
         tickets = ticketing_service.get_user_tickets(user_id)
 
         # Serialize all tickets
-        serialized_tickets = [_serialize_ticket(ticket) for ticket in tickets]
-        response_data = {
-            "tickets": serialized_tickets,
-            "total_count": len(tickets)
-        }
+        response_data = _serialize_ticket_list(tickets)
 
         return success_response(
             message="User tickets retrieved successfully",
@@ -477,11 +494,7 @@ def get_open_tickets_controller(current_user_id):
         tickets = ticketing_service.get_open_tickets()
 
         # Serialize all tickets
-        serialized_tickets = [_serialize_ticket(ticket) for ticket in tickets]
-        response_data = {
-            "tickets": serialized_tickets,
-            "total_count": len(tickets)
-        }
+        response_data = _serialize_ticket_list(tickets)
 
         return success_response(
             message="Open tickets retrieved successfully",
@@ -514,11 +527,7 @@ def get_resolved_tickets_controller(current_user_id):
         tickets = ticketing_service.get_resolved_tickets()
 
         # Serialize all tickets
-        serialized_tickets = [_serialize_ticket(ticket) for ticket in tickets]
-        response_data = {
-            "tickets": serialized_tickets,
-            "total_count": len(tickets)
-        }
+        response_data = _serialize_ticket_list(tickets)
 
         return success_response(
             message="Resolved tickets retrieved successfully",
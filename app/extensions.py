@@ -8,6 +8,8 @@ from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
 from flask_migrate import Migrate
 from flask_mail import Mail
+from flask_caching import Cache
+from celery import Celery, Task
 
 # Initialize extensions
 db = SQLAlchemy()
@@ -15,6 +17,7 @@ bcrypt = Bcrypt()
 jwt = JWTManager()
 migrate = Migrate()
 mail = Mail()
+cache = Cache()
 
 
 def init_extensions(app):
@@ -24,3 +27,24 @@ def init_extensions(app):
     jwt.init_app(app)
     migrate.init_app(app, db)
     mail.init_app(app)
+    cache.init_app(app)
+    celery_init_app(app)
+
+
+def celery_init_app(app):
+    """
+    Create the Celery app for this Flask app.
+
+    Tasks run inside the Flask app context, and the Celery app is stored on
+    app.extensions['celery'] for the worker entry point (make_celery.py).
+    """
+    class FlaskTask(Task):
+        def __call__(self, *args, **kwargs):
+            with app.app_context():
+                return self.run(*args, **kwargs)
+
+    celery_app = Celery(app.name, task_cls=FlaskTask)
+    celery_app.config_from_object(app.config['CELERY'])
+    celery_app.set_default()
+    app.extensions['celery'] = celery_app
+    return celery_app
@@ -5,6 +5,7 @@ Handles rental bookings and their details.
 
 import enum
 from datetime import datetime
+from sqlalchemy import inspect as sa_inspect
 from app.extensions import db
 
 
@@ -23,6 +24,12 @@ class Booking(db.Model):
     """Booking model for rental bookings."""
 
     __tablename__ = 'bookings'
+    __table_args__ = (
+        # Overlap/availability checks filter on all four columns
+        db.Index('ix_booking_item_status_dates', 'item_id', 'status', 'start_date', 'end_date'),
+        # Per-user listings/history filter by user_id and sort by created_at
+        db.Index('ix_booking_user_created', 'user_id', 'created_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     start_date = db.Column(db.Date, nullable=False)
@@ -71,9 +78,18 @@ class Booking(db.Model):
 
     def calculate_total_price(self):
         """Calculate total price based on duration and item price."""
-        if self.item and self.duration_days > 0:
-            return self.item.price_per_day * self.duration_days
-        return 0.0
+        from app.models.item import Item
+
+        if self.duration_days <= 0:
+            return 0.0
+        if 'item' not in sa_inspect(self).unloaded:
+            price_per_day = self.item.price_per_day if self.item is not None else None
+        else:
+            # Read only the price instead of lazy-loading the whole Item
+            price_per_day = db.session.query(Item.price_per_day).filter(Item.id == self.item_id).scalar()
+        if price_per_day is None:
+            return 0.0
+        return price_per_day * self.duration_days
 
     @classmethod
     def find_by_id(cls, booking_id):
@@ -101,7 +117,7 @@ class Booking(db.Model):
         db.session.commit()
 
     @classmethod
-    def check_item_availability(cls, item_id, start_date, end_date, requested_quantity=1, exclude_booking_id=None):
+    def check_item_availability(cls, item_id, start_date, end_date, requested_quantity=1, exclude_booking_id=None, item=None):
         """
         Check if an item is available for booking in the given date range with quantity support.
         
@@ -117,6 +133,7 @@ class Booking(db.Model):
             end_date: End date of the requested booking
             requested_quantity: Number of items requested (default: 1)
             exclude_booking_id: Optional booking ID to exclude from check (for updates)
+            item: Optional already-loaded Item, to skip fetching it again
             
         Returns:
             dict: Enhanced availability information with quantity details
@@ -125,7 +142,8 @@ class Booking(db.Model):
         from datetime import datetime, timedelta
         
         # Get the item to check its total quantity
-        item = Item.query.get(item_id)
+        if item is None:
+            item = Item.query.get(item_id)
         if not item:
             return {
                 'available': False,
@@ -197,6 +215,29 @@ class Booking(db.Model):
             'pending_expiring_soon': expiring_soon_quantity
         }
     
+    @classmethod
+    def reserved_quantity_subquery(cls, item_id, start_date, end_date, now=None):
+        """
+        Scalar subquery summing the quantity reserved for an item in a date range.
+
+        Applies the same rules as check_item_availability: PAID/CONFIRMED
+        bookings always count, PENDING bookings only until they expire.
+        Intended for embedding in a larger statement.
+        """
+        now = now or datetime.utcnow()
+        return db.select(db.func.coalesce(db.func.sum(cls.quantity), 0)).where(
+            cls.item_id == item_id,
+            cls.start_date <= end_date,
+            cls.end_date >= start_date,
+            db.or_(
+                cls.status.in_([BookingStatus.PAID, BookingStatus.CONFIRMED]),
+                db.and_(
+                    cls.status == BookingStatus.PENDING,
+                    db.or_(cls.expires_at.is_(None), cls.expires_at > now)
+                )
+            )
+        ).scalar_subquery()
+
     @classmethod
     def get_availability_calendar(cls, item_id, start_date, end_date):
         """
@@ -258,3 +299,26 @@ class Booking(db.Model):
             return False
         
         return datetime.utcnow() > self.expires_at
+
+    @classmethod
+    def bulk_expire_pending(cls, now=None):
+        """
+        Cancel every PENDING booking whose expires_at has passed.
+
+        Runs as one UPDATE; the caller commits.
+
+        Returns:
+            int: Number of bookings expired
+        """
+        now = now or datetime.utcnow()
+        result = db.session.execute(
+            db.update(cls)
+            .where(
+                cls.status == BookingStatus.PENDING,
+                cls.expires_at.isnot(None),
+                cls.expires_at < now
+            )
+            .values(status=BookingStatus.CANCELLED, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
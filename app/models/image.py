@@ -11,6 +11,10 @@ class Image(db.Model):
     """Image model for item images."""
 
     __tablename__ = 'images'
+    __table_args__ = (
+        # Item pages load every image of an item by item_id
+        db.Index('ix_images_item_id', 'item_id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     image_base64 = db.Column(db.Text, nullable=False)
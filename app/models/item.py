@@ -47,6 +47,16 @@ class Item(db.Model):
     """Item model for outfit rental management."""
 
     __tablename__ = 'items'
+    __table_args__ = (
+        # Owner listings and owner revenue join/filter on the owning user
+        db.Index('ix_items_user_id', 'user_id'),
+        # Recently-added listing orders by created_at and takes the top N
+        db.Index('ix_items_created_at', 'created_at'),
+        # Top-rated listing orders by the denormalized rating
+        db.Index('ix_items_rating', 'rating'),
+        # Popular listing reads the top N by the denormalized booking count
+        db.Index('ix_items_booking_count', db.desc(db.column('booking_count'))),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -60,6 +70,8 @@ class Item(db.Model):
     description = db.Column(db.Text, nullable=False)
     price_per_day = db.Column(db.Float, nullable=False)
     rating = db.Column(db.Float, default=0.0, nullable=False)
+    # Bookings ever made for this item, kept in step by BookingService
+    booking_count = db.Column(db.Integer, default=0, server_default='0', nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
 
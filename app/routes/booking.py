@@ -32,7 +32,9 @@ def require_jwt():
 @booking_bp.route('/', methods=['GET'])
 def get_bookings():
     current_user_id = get_jwt_identity()
-    return get_all_bookings_controller(current_user_id)
+    page = request.args.get('page', type=int)
+    per_page = request.args.get('per_page', type=int)
+    return get_all_bookings_controller(current_user_id, page, per_page)
 
 # Create a new booking
 @booking_bp.route('/', methods=['POST'])
@@ -92,7 +94,8 @@ def get_bookings_by_status(status):
 def get_booking_history():
     current_user_id = get_jwt_identity()
     limit = request.args.get('limit', default=20, type=int)
-    return get_booking_history_controller(current_user_id, limit)
+    before_id = request.args.get('before_id', type=int)
+    return get_booking_history_controller(current_user_id, limit, before_id)
 
 # Get bookings for items owned by current user
 @booking_bp.route('/item/<int:item_id>', methods=['GET'])
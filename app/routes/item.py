@@ -8,7 +8,9 @@ item_bp = Blueprint('item', __name__, url_prefix='/items')
 # GET /items - List all available items
 @item_bp.route('', methods=['GET'])
 def list_items():
-    return list_items_controller()
+    page = request.args.get('page', type=int)
+    per_page = request.args.get('per_page', type=int)
+    return list_items_controller(page, per_page)
 
 # POST /items - Create a new item (admin only)
 @item_bp.route('', methods=['POST'])
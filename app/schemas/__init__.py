@@ -23,7 +23,8 @@ from .user_schema import (
     UserListResponseSchema,
     UserStatsSchema,
     UserSearchSchema,
-    UserVerificationSchema
+    UserVerificationSchema,
+    USER_LIST_ADAPTER
 )
 
 # Authentication schemas
@@ -146,6 +147,7 @@ __all__ = [
     'UserStatsSchema',
     'UserSearchSchema',
     'UserVerificationSchema',
+    'USER_LIST_ADAPTER',
 
     # Auth
     'LoginSchema',
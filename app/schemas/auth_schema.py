@@ -3,9 +3,10 @@ Authentication schemas for request/response validation.
 """
 
 from typing import Optional
-from pydantic import EmailStr, Field, field_validator
+from pydantic import EmailStr, Field, field_validator, model_validator
 from app.schemas.base_schema import BaseSchema
 from app.schemas.user_schema import UserResponseSchema
+from app.schemas.types import StrongPasswordStr
 
 
 class LoginSchema(BaseSchema):
@@ -31,33 +32,18 @@ class RegisterSchema(BaseSchema):
     """Schema for user registration, aligned with User model."""
 
     email: EmailStr = Field(..., description="User email address")
-    password: str = Field(..., min_length=8, max_length=128, description="User password")
+    password: StrongPasswordStr = Field(..., description="User password")
     first_name: str = Field(..., min_length=1, max_length=50, description="User first name")
     last_name: str = Field(..., min_length=1, max_length=50, description="User last name")
     phone_number: Optional[str] = Field(None, max_length=20, description="User phone number")
 
-    @field_validator('password')
-    @classmethod
-    def validate_password(cls, v):
-        """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not any(c.isdigit() for c in v):
-            raise ValueError('Password must contain at least one digit')
-        if not any(c.isupper() for c in v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not any(c.islower() for c in v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        return v
-
-
     @field_validator('phone_number')
     @classmethod
     def validate_phone(cls, v):
         """Validate phone number format."""
         if v is not None:
-            cleaned = ''.join(filter(str.isdigit, v))
-            if len(cleaned) < 10 or len(cleaned) > 15:
+            digits = sum(map(str.isdigit, v))
+            if digits < 10 or digits > 15:
                 raise ValueError('Phone number must be between 10-15 digits')
         return v
 
@@ -95,30 +81,15 @@ class PasswordResetSchema(BaseSchema):
     """Schema for password reset."""
 
     token: str = Field(..., description="Password reset token")
-    new_password: str = Field(..., min_length=8, max_length=128, description="New password")
+    new_password: StrongPasswordStr = Field(..., description="New password")
     confirm_password: str = Field(..., description="Confirm new password")
 
-    @field_validator('new_password')
-    @classmethod
-    def validate_password(cls, v):
-        """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not any(c.isdigit() for c in v):
-            raise ValueError('Password must contain at least one digit')
-        if not any(c.isupper() for c in v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not any(c.islower() for c in v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        return v
-
-    @field_validator('confirm_password')
-    @classmethod
-    def passwords_match(cls, v, values):
+    @model_validator(mode='after')
+    def passwords_match(self):
         """Validate that passwords match."""
-        if 'new_password' in values.data and v != values.data['new_password']:
+        if self.new_password != self.confirm_password:
             raise ValueError('Passwords do not match')
-        return v
+        return self
 
 
 class EmailVerificationSchema(BaseSchema):
@@ -137,30 +108,15 @@ class ChangePasswordSchema(BaseSchema):
     """Schema for changing password (authenticated user)."""
 
     current_password: str = Field(..., description="Current password")
-    new_password: str = Field(..., min_length=8, max_length=128, description="New password")
+    new_password: StrongPasswordStr = Field(..., description="New password")
     confirm_password: str = Field(..., description="Confirm new password")
 
-    @field_validator('new_password')
-    @classmethod
-    def validate_password(cls, v):
-        """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not any(c.isdigit() for c in v):
-            raise ValueError('Password must contain at least one digit')
-        if not any(c.isupper() for c in v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not any(c.islower() for c in v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        return v
-
-    @field_validator('confirm_password')
-    @classmethod
-    def passwords_match(cls, v, values):
+    @model_validator(mode='after')
+    def passwords_match(self):
         """Validate that passwords match."""
-        if 'new_password' in values.data and v != values.data['new_password']:
+        if self.new_password != self.confirm_password:
             raise ValueError('Passwords do not match')
-        return v
+        return self
 
 
 class LogoutSchema(BaseSchema):
@@ -3,8 +3,8 @@ Pydantic schemas for ticketing endpoints validation and serialization.
 Following clean code principles with clear, beginner-friendly validation.
 """
 
-from typing import Optional, List
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Annotated, Optional, List
+from pydantic import BaseModel, Field, StringConstraints, TypeAdapter, field_validator, ConfigDict
 
 
 class CreateTicketRequest(BaseModel):
@@ -17,24 +17,10 @@ class CreateTicketRequest(BaseModel):
     - booking_id: Optional - if related to a specific booking
     """
     user_id: int = Field(..., gt=0, description="Valid user ID who is creating the ticket")
-    message: str = Field(..., min_length=1, max_length=5000, description="Initial ticket message describing the issue")
-    booking_id: Optional[int] = Field(default=None, description="Optional booking ID if ticket is booking-related")
-
-    @field_validator('message')
-    @classmethod
-    def validate_message_content(cls, value):
-        """Ensure message is not just empty or whitespace."""
-        if not value or not value.strip():
-            raise ValueError('Message cannot be empty or contain only whitespace')
-        return value.strip()
-
-    @field_validator('booking_id')
-    @classmethod
-    def validate_booking_id_positive(cls, value):
-        """Ensure booking ID is positive if provided."""
-        if value is not None and value <= 0:
-            raise ValueError('Booking ID must be a positive integer')
-        return value
+    message: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=5000)] = Field(
+        ..., description="Initial ticket message describing the issue"
+    )
+    booking_id: Optional[int] = Field(default=None, gt=0, description="Optional booking ID if ticket is booking-related")
 
 
 class AddMessageRequest(BaseModel):
@@ -43,42 +29,20 @@ class AddMessageRequest(BaseModel):
 
     Used when customer or support adds a reply to the conversation.
     """
-    message: str = Field(..., min_length=1, max_length=2000, description="Message content to add to the ticket conversation")
-
-    @field_validator('message')
-    @classmethod
-    def validate_message_content(cls, value):
-        """Ensure message is meaningful and not empty."""
-        if not value or not value.strip():
-            raise ValueError('Message cannot be empty or contain only whitespace')
-        return value.strip()
+    message: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=2000)] = Field(
+        ..., description="Message content to add to the ticket conversation"
+    )
 
 
 class TicketIdRequest(BaseModel):
     """Schema for validating ticket ID parameters in URLs."""
     ticket_id: int = Field(..., gt=0, description="Valid ticket ID")
 
-    @field_validator('ticket_id')
-    @classmethod
-    def validate_ticket_id_positive(cls, value):
-        """Ensure ticket ID is a positive integer."""
-        if value <= 0:
-            raise ValueError('Ticket ID must be a positive integer')
-        return value
-
 
 class UserIdRequest(BaseModel):
     """Schema for validating user ID parameters in URLs."""
     user_id: int = Field(..., gt=0, description="Valid user ID")
 
-    @field_validator('user_id')
-    @classmethod
-    def validate_user_id_positive(cls, value):
-        """Ensure user ID is a positive integer."""
-        if value <= 0:
-            raise ValueError('User ID must be a positive integer')
-        return value
-
 
 class TicketResponse(BaseModel):
     """
@@ -95,7 +59,8 @@ class TicketResponse(BaseModel):
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    # Read-only response rows: ignore unknown attributes, no assignment checks
+    model_config = ConfigDict(from_attributes=True, extra='ignore', frozen=True, validate_assignment=False)
 
     @field_validator('created_at', 'updated_at', mode='before')
     @classmethod
@@ -128,6 +93,11 @@ class TicketResponse(BaseModel):
         # For any other type, try string conversion
         return str(value) if value is not None else None
 
+
+# Built once at import so list endpoints validate all rows in a single call
+TICKET_LIST_ADAPTER = TypeAdapter(List[TicketResponse])
+
+
 class TicketListResponse(BaseModel):
     """
     Schema for returning multiple tickets with metadata.
@@ -137,6 +107,8 @@ class TicketListResponse(BaseModel):
     tickets: List[TicketResponse]
     total_count: int
 
+    model_config = ConfigDict(from_attributes=True, extra='ignore', frozen=True, validate_assignment=False)
+
     @field_validator('total_count')
     @classmethod
     def validate_count_non_negative(cls, value):
@@ -165,15 +137,9 @@ class TicketStatsResponse(BaseModel):
         return value
 
 
-# Legacy compatibility schemas - keeping these for backward compatibility
-class TicketCreateRequest(CreateTicketRequest):
-    """Alias for backward compatibility with existing code."""
-    pass
-
-
-class TicketUpdateRequest(AddMessageRequest):
-    """Alias for backward compatibility with existing code."""
-    pass
+# Legacy compatibility names - plain aliases so no extra schema is built
+TicketCreateRequest = CreateTicketRequest
+TicketUpdateRequest = AddMessageRequest
 
 
 class UpdateTicketStatusRequest(BaseModel):
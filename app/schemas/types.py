@@ -0,0 +1,33 @@
+"""
+Shared annotated field types for schema validation.
+"""
+
+import re
+from typing import Annotated
+from pydantic import AfterValidator, Field
+
+# Single-pass password strength checks, 8-128 chars
+_PASSWORD_RE = re.compile(r"^(?=.*\d)(?=.*[A-Z]).{8,128}$", re.DOTALL)
+_STRONG_PASSWORD_RE = re.compile(r"^(?=.*\d)(?=.*[A-Z])(?=.*[a-z]).{8,128}$", re.DOTALL)
+
+
+def _check_password(v: str) -> str:
+    """Require at least one digit and one uppercase letter."""
+    if not _PASSWORD_RE.match(v):
+        raise ValueError("Password must contain at least one digit and one uppercase letter")
+    return v
+
+
+def _check_strong_password(v: str) -> str:
+    """Require at least one digit, one uppercase and one lowercase letter."""
+    if not _STRONG_PASSWORD_RE.match(v):
+        raise ValueError(
+            "Password must contain at least one digit, one uppercase and one lowercase letter"
+        )
+    return v
+
+
+PasswordStr = Annotated[str, Field(min_length=8, max_length=128), AfterValidator(_check_password)]
+StrongPasswordStr = Annotated[
+    str, Field(min_length=8, max_length=128), AfterValidator(_check_strong_password)
+]
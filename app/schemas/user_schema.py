@@ -4,17 +4,16 @@ User schemas for request/response validation.
 
 from datetime import datetime
 from typing import Optional
-from pydantic import EmailStr, Field, field_validator
+from pydantic import ConfigDict, EmailStr, Field, TypeAdapter, field_validator, model_validator
 from app.schemas.base_schema import BaseSchema, TimestampMixin, ResponseSchema
+from app.schemas.types import PasswordStr
 
 
 class UserCreateSchema(BaseSchema):
     """Schema for creating a new user, aligned with User model."""
 
     email: EmailStr = Field(..., description="User email address")
-    password: str = Field(
-        ..., min_length=8, max_length=128, description="User password"
-    )
+    password: PasswordStr = Field(..., description="User password")
     first_name: str = Field(
         ..., min_length=1, max_length=50, description="User first name"
     )
@@ -25,25 +24,13 @@ class UserCreateSchema(BaseSchema):
         None, max_length=20, description="User phone number"
     )
 
-    @field_validator("password")
-    @classmethod
-    def validate_password(cls, v):
-        """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters long")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        return v
-
     @field_validator("phone_number")
     @classmethod
     def validate_phone(cls, v):
         """Validate phone number format."""
         if v is not None:
-            cleaned = "".join(filter(str.isdigit, v))
-            if len(cleaned) < 10 or len(cleaned) > 15:
+            digits = sum(map(str.isdigit, v))
+            if digits < 10 or digits > 15:
                 raise ValueError("Phone number must be between 10-15 digits")
         return v
 
@@ -107,8 +94,8 @@ class UserUpdateSchema(BaseSchema):
     def validate_phone(cls, v):
         """Validate phone number format."""
         if v is not None:
-            cleaned = "".join(filter(str.isdigit, v))
-            if len(cleaned) < 10 or len(cleaned) > 15:
+            digits = sum(map(str.isdigit, v))
+            if digits < 10 or digits > 15:
                 raise ValueError("Phone number must be between 10-15 digits")
         return v
 
@@ -117,37 +104,25 @@ class UserPasswordUpdateSchema(BaseSchema):
     """Schema for updating user password."""
 
     current_password: str = Field(..., description="Current password")
-    new_password: str = Field(
-        ..., min_length=8, max_length=128, description="New password"
-    )
+    new_password: PasswordStr = Field(..., description="New password")
     confirm_password: str = Field(..., description="Confirm new password")
 
-    @field_validator("new_password")
-    @classmethod
-    def validate_new_password(cls, v):
-        """Validate new password strength."""
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters long")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        return v
-
-    @field_validator("confirm_password")
-    @classmethod
-    def passwords_match(cls, v, values):
+    @model_validator(mode="after")
+    def passwords_match(self):
         """Validate that passwords match."""
-        if "new_password" in values.data and v != values.data["new_password"]:
+        if self.new_password != self.confirm_password:
             raise ValueError("Passwords do not match")
-        return v
+        return self
 
 
 class UserResponseSchema(BaseSchema, TimestampMixin):
     """Schema for user response, aligned with User model."""
 
+    # Read-only response rows: ignore unknown attributes, no assignment checks
+    model_config = ConfigDict(extra="ignore", frozen=True, validate_assignment=False)
+
     id: int
-    email: EmailStr
+    email: str  # Validated on the way in; not re-checked for DB-origin rows
     first_name: str
     last_name: str
     phone_number: Optional[str] = None
@@ -200,3 +175,7 @@ class UserVerificationSchema(BaseSchema):
 
     user_id: int = Field(..., description="User ID to verify")
     verify: bool = Field(..., description="Verification status")
+
+
+# Built once at import so list endpoints validate all rows in a single call
+USER_LIST_ADAPTER = TypeAdapter(list[UserResponseSchema])
@@ -3,44 +3,127 @@ Base service class for common database operations.
 All service classes should inherit from this base class.
 """
 
+from contextlib import contextmanager
+from sqlalchemy import select, inspect as sa_inspect
+from sqlalchemy.ext.hybrid import hybrid_property
 from app.extensions import db
 
 
 class BaseService:
     """Base service class with common CRUD operations."""
 
+    # Settable attribute names per model class, computed once on first update()
+    _allowed_attrs = {}
+
     def __init__(self, model_class):
         """Initialize service with model class."""
         self.model_class = model_class
 
+    @staticmethod
+    def _batch_depth():
+        """Open batch() blocks on the current session (shared by all services)."""
+        return db.session.info.get('batch_depth', 0)
+
+    @staticmethod
+    def _set_batch_depth(depth):
+        db.session.info['batch_depth'] = depth
+
+    def _commit(self):
+        """Commit the session, or only flush it while inside a batch."""
+        if self._batch_depth():
+            db.session.flush()
+        else:
+            db.session.commit()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several writes into a single transaction.
+
+        save/update/delete calls made inside the block only flush; the
+        outermost block commits once on exit and rolls back on error.
+        The depth is kept on the session, which Flask-SQLAlchemy scopes to
+        the app context, so writes through any service inside the block
+        join the same transaction and other requests are unaffected.
+        """
+        depth = self._batch_depth() + 1
+        self._set_batch_depth(depth)
+        try:
+            yield self
+        except Exception:
+            self._set_batch_depth(depth - 1)
+            if depth == 1:
+                db.session.rollback()
+            raise
+        self._set_batch_depth(depth - 1)
+        if depth == 1:
+            db.session.commit()
+
     def save(self, instance):
         """Save instance to database."""
         db.session.add(instance)
-        db.session.commit()
+        self._commit()
         return instance
 
     def delete(self, instance):
         """Delete instance from database."""
         db.session.delete(instance)
-        db.session.commit()
+        self._commit()
 
     def get_by_id(self, instance_id):
         """Get instance by ID."""
         return db.session.get(self.model_class, instance_id)
 
-    def get_all(self):
-        """Get all instances."""
-        return self.model_class.query.all()
+    def get_many_by_ids(self, instance_ids):
+        """Get several instances by ID with a single query."""
+        if not instance_ids:
+            return []
+        stmt = select(self.model_class).where(self.model_class.id.in_(instance_ids))
+        return db.session.scalars(stmt).all()
+
+    def get_all(self, limit=None, offset=0):
+        """Get all instances, optionally paginated with limit/offset."""
+        stmt = select(self.model_class)
+        if limit is not None:
+            # Pages need a stable order or rows can repeat or go missing
+            stmt = stmt.order_by(self.model_class.id).limit(limit).offset(offset)
+        return db.session.scalars(stmt).all()
+
+    def iter_all(self, chunk_size=500):
+        """Stream all instances, loading chunk_size rows at a time."""
+        stmt = select(self.model_class).execution_options(yield_per=chunk_size)
+        return db.session.scalars(stmt)
 
     def create(self, **kwargs):
         """Create new instance."""
         instance = self.model_class(**kwargs)
         return self.save(instance)
 
+    def bulk_create(self, records):
+        """Create several instances from a list of kwargs dicts in one commit."""
+        instances = [self.model_class(**kwargs) for kwargs in records]
+        db.session.add_all(instances)
+        self._commit()
+        return instances
+
+    @staticmethod
+    def _settable_attrs(model_class):
+        """Mapped attributes plus property/hybrid_property names that have a setter."""
+        names = set(sa_inspect(model_class).attrs.keys())
+        for klass in model_class.__mro__:
+            for name, attr in vars(klass).items():
+                if isinstance(attr, (property, hybrid_property)) and attr.fset is not None:
+                    names.add(name)
+        return frozenset(names)
+
     def update(self, instance, **kwargs):
         """Update instance with new data."""
+        model_class = type(instance)
+        allowed = self._allowed_attrs.get(model_class)
+        if allowed is None:
+            allowed = self._allowed_attrs.setdefault(model_class, self._settable_attrs(model_class))
         for key, value in kwargs.items():
-            if hasattr(instance, key):
+            if key in allowed:
                 setattr(instance, key, value)
         return self.save(instance)
 
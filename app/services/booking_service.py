@@ -1,20 +1,71 @@
 from datetime import datetime, timedelta, date
 from app.services.base_service import BaseService
+from app.services.item_service import ItemService
 from app.models.booking import Booking, BookingStatus
 from app.models.item import Item
 from app.models.user import User
-from app.extensions import db
-from sqlalchemy.orm import joinedload
+from app.extensions import db, cache
+from sqlalchemy import exists, func, insert, literal, select, tuple_, update
+from sqlalchemy.orm import aliased, raiseload, selectinload
+from flask import current_app, g, has_request_context
 from typing import List, Optional
 
 
+# Columns needed to render a booking in read-only list responses (BookingOut)
+_BOOKING_LIST_COLUMNS = (
+    Booking.id,
+    Booking.user_id,
+    Booking.item_id,
+    Booking.start_date,
+    Booking.end_date,
+    Booking.quantity,
+    Booking.total_price,
+    Booking.status,
+    Booking.is_paid,
+)
+
+# List endpoints render BookingOut plus item.name; any other lazy load is a bug
+_LIST_LOAD_OPTIONS = (selectinload(Booking.item), raiseload('*'))
+
+# Status groups used by membership checks and IN (...) filters
+_ACTIVE_STATUSES = (BookingStatus.CONFIRMED, BookingStatus.PENDING)
+_TERMINAL_STATUSES = frozenset((BookingStatus.COMPLETED, BookingStatus.CANCELLED))
+_CANCELLABLE_STATUSES = (BookingStatus.PENDING, BookingStatus.CONFIRMED)
+
+# Read-heavy listings are memoized briefly and dropped on every booking write
+_CACHE_TIMEOUT = 60
+
+# ItemService keeps no per-call state, so one instance is shared by all calls
+_item_service = ItemService()
+
+
+def _verification_status(user_id):
+    """
+    Return the user's is_verified flag, or None if the user does not exist.
+
+    Reads a single column instead of hydrating a User, and is memoized on
+    flask.g for the duration of the current request.
+    """
+    if not has_request_context():
+        return db.session.query(User.is_verified).filter(User.id == user_id).scalar()
+    memo = g.setdefault('_verified_cache', {})
+    if user_id not in memo:
+        memo[user_id] = db.session.query(User.is_verified).filter(User.id == user_id).scalar()
+    return memo[user_id]
+
+
+def _is_verified(user_id):
+    """Return True only for an existing, verified user."""
+    return _verification_status(user_id) is True
+
+
 class BookingService(BaseService):
 
     def __init__(self):
         super().__init__(Booking)
 
     @staticmethod
-    def check_availability(item_id: int, start_date: date, end_date: date, requested_quantity: int = 1) -> dict:
+    def check_availability(item_id: int, start_date: date, end_date: date, requested_quantity: int = 1, item: Optional[Item] = None) -> dict:
         """
         Check item availability using the comprehensive booking model method.
         
@@ -23,14 +74,15 @@ class BookingService(BaseService):
             start_date: Start date for booking
             end_date: End date for booking
             requested_quantity: Number of items requested (default: 1)
+            item: Optional already-loaded Item, to avoid a second lookup
             
         Returns:
             dict: Detailed availability information
         """
         try:
-            return Booking.check_item_availability(item_id, start_date, end_date, requested_quantity)
+            return Booking.check_item_availability(item_id, start_date, end_date, requested_quantity, item=item)
         except Exception as e:
-            print(f"BookingService.check_availability error: {e}")
+            current_app.logger.error("BookingService.check_availability error: %s", e)
             # Return unavailable if there's an error to prevent double bookings
             return {
                 'available': False,
@@ -42,81 +94,107 @@ class BookingService(BaseService):
             }
 
     @staticmethod
-    def create_booking(user_id: int, item_id: int, start_date: date, end_date: date, quantity: int = 1) -> Optional[Booking]:
-        # Check user exists and is verified
-        user = User.query.get(user_id)
-        if not user:
-            raise ValueError("User not found")
-        if not getattr(user, 'is_verified', False):
-            raise ValueError("Email verification is required to create bookings. Please check your email for a verification link.")
-        
-        # Validate quantity
-        if quantity < 1 or quantity > 10:
-            raise ValueError("Quantity must be between 1 and 10")
-        
-        # Check availability using the comprehensive method
-        availability = BookingService.check_availability(item_id, start_date, end_date, quantity)
-        if not availability['available'] or not availability['can_fulfill']:
+    def create_booking(user_id: int, item_id: int, start_date: date, end_date: date, quantity: int = 1) -> Booking:
+        """
+        Create a PENDING booking for a verified user.
+
+        The verification check, availability check, price lookup and insert
+        run as one INSERT ... SELECT; the reasons for a refusal are only looked
+        up when nothing was inserted.
+        """
+        now = datetime.utcnow()
+        duration = (end_date - start_date).days + 1
+        reserved = Booking.reserved_quantity_subquery(item_id, start_date, end_date, now)
+        # FOR UPDATE locks the item row until commit, so concurrent bookings for
+        # the same item serialize and each sees every committed reservation
+        source = select(
+            literal(user_id),
+            Item.id,
+            literal(start_date),
+            literal(end_date),
+            literal(quantity),
+            Item.price_per_day * (duration * quantity),  # Price includes quantity
+            literal(BookingStatus.PENDING, Booking.status.type),
+            literal(False),
+            # Set expiration for PENDING booking (30 minutes from creation)
+            literal(now + timedelta(minutes=30)),
+            literal(now),
+            literal(now)
+        ).where(
+            Item.id == item_id,
+            exists().where(User.id == user_id, User.is_verified.is_(True)),
+            Item.quantity - reserved >= quantity
+        ).with_for_update(of=Item)
+        stmt = insert(Booking).from_select(
+            ['user_id', 'item_id', 'start_date', 'end_date', 'quantity', 'total_price',
+             'status', 'is_paid', 'expires_at', 'created_at', 'updated_at'],
+            source
+        ).returning(Booking)
+        booking = db.session.scalars(stmt).one_or_none() if 1 <= quantity <= 10 else None
+
+        if booking is None:
+            # Nothing inserted: look up why, in the order the checks are reported
+            db.session.rollback()
+            is_verified = _verification_status(user_id)
+            if is_verified is None:
+                raise ValueError("User not found")
+            if not is_verified:
+                raise ValueError("Email verification is required to create bookings. Please check your email for a verification link.")
+            if quantity < 1 or quantity > 10:
+                raise ValueError("Quantity must be between 1 and 10")
+            availability = BookingService.check_availability(item_id, start_date, end_date, quantity)
             if 'error' in availability:
                 raise ValueError(f"Availability check failed: {availability['error']}")
-            else:
-                available_qty = availability['available_quantity']
-                total_qty = availability['total_quantity']
-                raise ValueError(
-                    f"Insufficient quantity available. "
-                    f"Requested: {quantity}, Available: {available_qty}/{total_qty}"
-                )
-            
-        item = Item.query.get(item_id)
-        if not item:
-            raise ValueError("Item not found")
-            
-        duration = (end_date - start_date).days + 1
-        total_price = item.price_per_day * duration * quantity  # Price includes quantity
-        booking = Booking(
-            user_id=user_id,
-            item_id=item_id,
-            start_date=start_date,
-            end_date=end_date,
-            quantity=quantity,
-            total_price=total_price,
-            status=BookingStatus.PENDING,
-            is_paid=False
+            raise ValueError(
+                f"Insufficient quantity available. "
+                f"Requested: {quantity}, Available: "
+                f"{availability['available_quantity']}/{availability['total_quantity']}"
+            )
+
+        # Keep the popular-items counter in the same transaction
+        db.session.execute(
+            update(Item).where(Item.id == item_id)
+            .values(booking_count=Item.booking_count + 1)
+            .execution_options(synchronize_session=False)
         )
-        
-        # Set expiration for PENDING booking (30 minutes from creation)
-        booking.expires_at = datetime.utcnow() + timedelta(minutes=30)
-        
-        db.session.add(booking)
         db.session.commit()
+        _invalidate_cached_reads()
+        ItemService.invalidate_popular_items()
         return booking
 
     @staticmethod
     def get_user_bookings(user_id: int) -> List[Booking]:
-        from sqlalchemy.orm import joinedload
         # Check user exists and is verified
-        user = User.query.get(user_id)
-        if not user:
+        is_verified = _verification_status(user_id)
+        if is_verified is None:
             raise ValueError("User not found")
-        if not getattr(user, 'is_verified', False):
+        if not is_verified:
             raise ValueError("Email verification required to access bookings")
-        return Booking.query.options(joinedload(Booking.item)).filter_by(user_id=user_id).all()
+        return Booking.query.options(*_LIST_LOAD_OPTIONS).filter_by(user_id=user_id).all()
 
     @staticmethod
     def get_booking(booking_id: int, user_id: Optional[int] = None) -> Optional[Booking]:
-        booking = Booking.query.get(booking_id)
-        if not booking:
+        if user_id is None:
+            return db.session.get(Booking, booking_id)
+
+        # Fetch the booking and the caller's verification flag in one round-trip
+        row = db.session.execute(
+            select(
+                Booking,
+                select(User.is_verified).where(User.id == user_id).scalar_subquery()
+            ).where(Booking.id == booking_id)
+        ).first()
+        if row is None:
             return None
-        # If user_id is provided, verify user and check if booking belongs to them
-        if user_id is not None:
-            user = User.query.get(user_id)
-            if not user:
-                raise ValueError("User not found")
-            if not getattr(user, 'is_verified', False):
-                raise ValueError("Email verification required to access bookings")
-            if booking.user_id != user_id:
-                raise ValueError("Access denied: Booking does not belong to user")
-                
+
+        booking, is_verified = row
+        if is_verified is None:
+            raise ValueError("User not found")
+        if not is_verified:
+            raise ValueError("Email verification required to access bookings")
+        if booking.user_id != user_id:
+            raise ValueError("Access denied: Booking does not belong to user")
+
         return booking
 
     @staticmethod
@@ -135,16 +213,16 @@ class BookingService(BaseService):
         # Only allow status updates
         if 'status' not in kwargs or len(kwargs) > 1:
             return None
-        booking = Booking.query.get(booking_id)
+        booking = db.session.get(Booking, booking_id)
         if not booking:
             return None
         # If user_id is provided, verify user exists and is verified
         if user_id is not None:
-            user = User.query.get(user_id)
-            if not user or not getattr(user, 'is_verified', False):
+            user = db.session.query(User.is_verified, User.is_admin).filter(User.id == user_id).first()
+            if not user or not user.is_verified:
                 return None
             # Only check ownership if user is not an admin
-            if not getattr(user, 'is_admin', False) and booking.user_id != user_id:
+            if not user.is_admin and booking.user_id != user_id:
                 return None
 
         # Only update the status field
@@ -152,172 +230,218 @@ class BookingService(BaseService):
         if new_status and hasattr(booking, 'status'):
             booking.status = new_status
             db.session.commit()
+            _invalidate_cached_reads()
             return booking
 
         return None
 
     @staticmethod
-    def get_all_bookings() -> List[Booking]:
-        """Get all bookings in the system with pagination."""
-        return Booking.query.options(joinedload(Booking.item)).order_by(Booking.created_at.desc()).all()
+    def get_all_bookings(page: Optional[int] = None, per_page: int = 20) -> List[Booking]:
+        """Get bookings in the system, newest first; only one page when page is given."""
+        query = Booking.query.options(*_LIST_LOAD_OPTIONS).order_by(Booking.created_at.desc())
+        if page is not None:
+            query = query.limit(per_page).offset((page - 1) * per_page)
+        return query.all()
 
     def is_available_for_dates(self, item_id, start_date, end_date):
         """Check if item is available for the specified date range."""
         # Check if item exists and is available
-        from app.services.item_service import ItemService
-        item_service = ItemService()
-
-        if not item_service.is_item_available(item_id):
+        if not _item_service.is_item_available(item_id):
             return False
 
-        # Check for conflicting bookings
-        conflicting_bookings = Booking.query.filter(
-            Booking.item_id == item_id,
-            Booking.status.in_(['confirmed', 'pending']),
-            Booking.start_date <= end_date,
-            Booking.end_date >= start_date
-        ).count()
+        # Check for conflicting bookings; EXISTS stops at the first overlap
+        has_conflict = db.session.query(
+            Booking.query.filter(
+                Booking.item_id == item_id,
+                Booking.status.in_(_ACTIVE_STATUSES),
+                Booking.start_date <= end_date,
+                Booking.end_date >= start_date
+            ).exists()
+        ).scalar()
 
-        return conflicting_bookings == 0
+        return not has_conflict
 
     def get_bookings_by_renter(self, renter_id):
         """Get all bookings made by a specific renter."""
         # Check user exists and is verified
-        user = User.query.get(renter_id)
-        if not user or not getattr(user, 'is_verified', False):
+        if not _is_verified(renter_id):
             return []
-        return Booking.query.filter_by(user_id=renter_id).order_by(Booking.created_at.desc()).all()
-
-    def confirm_booking(self, booking_id):
-        """Confirm a pending booking."""
-        booking = self.get_by_id(booking_id)
-        if not booking:
-            return None
-
-        if booking.status != 'pending':
-            raise ValueError("Only pending bookings can be confirmed")
-
-        # Double-check availability
-        if not self.is_available_for_dates(booking.item_id, booking.start_date, booking.end_date):
-            raise ValueError("Item is no longer available for these dates")
+        return Booking.query.options(*_LIST_LOAD_OPTIONS).filter_by(
+            user_id=renter_id
+        ).order_by(Booking.created_at.desc()).all()
 
-        booking.status = 'confirmed'
+    @staticmethod
+    def _transition(booking_id, from_statuses, to_status):
+        """
+        Move a booking to to_status only if it is currently in from_statuses.
 
-        # Update item status to rented
-        from app.services.item_service import ItemService
-        item_service = ItemService()
-        item_service.mark_as_rented(booking.item_id)
+        Issues a single conditional UPDATE ... RETURNING, so the booking is
+        never loaded just to be mutated. Returns the updated booking, or None
+        if no row matched.
+        """
+        stmt = update(Booking).where(
+            Booking.id == booking_id,
+            Booking.status.in_(from_statuses)
+        ).values(status=to_status).returning(Booking)
+        return db.session.scalars(stmt).one_or_none()
 
-        return self.save(booking)
+    def confirm_booking(self, booking_id):
+        """Confirm a pending booking."""
+        with self.batch():
+            booking = self._transition(booking_id, [BookingStatus.PENDING], BookingStatus.CONFIRMED)
+            if booking is None:
+                if self.get_by_id(booking_id) is None:
+                    return None
+                raise ValueError("Only pending bookings can be confirmed")
+
+            # Double-check availability, ignoring this booking's own reservation
+            availability = Booking.check_item_availability(
+                booking.item_id, booking.start_date, booking.end_date,
+                booking.quantity, exclude_booking_id=booking.id
+            )
+            if not availability['can_fulfill']:
+                raise ValueError("Item is no longer available for these dates")
+
+        _invalidate_cached_reads()
+        return booking
 
     def complete_booking(self, booking_id):
         """Mark booking as completed."""
-        booking = self.get_by_id(booking_id)
-        if not booking:
-            return None
-
-        if booking.status != 'confirmed':
-            raise ValueError("Only confirmed bookings can be completed")
-
-        booking.status = 'completed'
-
-        # Update item status back to available
-        from app.services.item_service import ItemService
-        item_service = ItemService()
-        item_service.mark_as_available(booking.item_id)
-
-        return self.save(booking)
+        with self.batch():
+            booking = self._transition(booking_id, [BookingStatus.CONFIRMED], BookingStatus.COMPLETED)
+            if booking is None:
+                if self.get_by_id(booking_id) is None:
+                    return None
+                raise ValueError("Only confirmed bookings can be completed")
+
+        _invalidate_cached_reads()
+        return booking
 
     def cancel_booking(self, booking_id):
         """Cancel a booking."""
-        booking = self.get_by_id(booking_id)
-        if not booking:
-            return None
-
-        if booking.status in ['completed', 'cancelled']:
-            raise ValueError("Cannot cancel completed or already cancelled bookings")
-
-        booking.status = 'cancelled'
+        # Availability is derived from active bookings, so cancelling a
+        # confirmed booking releases its dates without touching the item
+        with self.batch():
+            booking = self._transition(booking_id, _CANCELLABLE_STATUSES, BookingStatus.CANCELLED)
+            if booking is None:
+                booking = self.get_by_id(booking_id)
+                if booking is None:
+                    return None
+                if booking.status in _TERMINAL_STATUSES:
+                    raise ValueError("Cannot cancel completed or already cancelled bookings")
+                raise ValueError("Only pending or confirmed bookings can be cancelled")
+
+        _invalidate_cached_reads()
+        return booking
 
-        # If booking was confirmed, make item available again
-        if booking.status == 'confirmed':
-            from app.services.item_service import ItemService
-            item_service = ItemService()
-            item_service.mark_as_available(booking.item_id)
+    @staticmethod
+    def invalidate_cached_reads():
+        """Drop memoized booking listings; call after writing bookings elsewhere."""
+        _invalidate_cached_reads()
 
-        return self.save(booking)
+    @staticmethod
+    def expire_pending_bookings():
+        """Cancel all PENDING bookings past their expiry; returns how many."""
+        expired = Booking.bulk_expire_pending()
+        db.session.commit()
+        if expired:
+            _invalidate_cached_reads()
+        return expired
 
     @staticmethod
+    @cache.memoize(timeout=_CACHE_TIMEOUT)
     def get_bookings_by_item(item_id):
-        """Get all bookings for a specific item."""
-        return Booking.query.filter_by(item_id=item_id).order_by(Booking.created_at.desc()).all()
+        """Get all bookings for a specific item as read-only dicts (cached)."""
+        stmt = select(*_BOOKING_LIST_COLUMNS).where(
+            Booking.item_id == item_id
+        ).order_by(Booking.created_at.desc())
+        return [dict(row) for row in db.session.execute(stmt).mappings()]
 
     @staticmethod
     def get_bookings_by_status(status):
-        """Get all bookings with a specific status."""
+        """Get all bookings with a specific status as read-only row mappings."""
         # Accept both Enum and string
         if isinstance(status, str):
             status = status.upper()
-        return Booking.query.filter_by(status=status).order_by(Booking.created_at.desc()).all()
+        stmt = select(*_BOOKING_LIST_COLUMNS).where(
+            Booking.status == status
+        ).order_by(Booking.created_at.desc())
+        return db.session.execute(stmt).mappings().all()
+
+    def get_booking_history(self, user_id, limit=20, before_id=None):
+        """
+        Get booking history for a user, newest first.
 
-    def get_booking_history(self, user_id, limit=20):
-        """Get booking history for a user."""
+        Pass the id of the last booking already received as before_id to get
+        the next page; the (created_at, id) keyset seeks straight to it.
+        """
         # Check user exists and is verified
-        user = User.query.get(user_id)
-        if not user:
+        is_verified = _verification_status(user_id)
+        if is_verified is None:
             raise ValueError("User not found")
-        if not getattr(user, 'is_verified', False):
+        if not is_verified:
             raise ValueError("Email verification required to access booking history")
-        return Booking.query.filter_by(user_id=user_id).order_by(
-            Booking.created_at.desc()
+        query = Booking.query.options(raiseload('*')).filter_by(user_id=user_id)
+        if before_id is not None:
+            cursor = aliased(Booking)
+            cursor_created_at = select(cursor.created_at).where(cursor.id == before_id).scalar_subquery()
+            query = query.filter(tuple_(Booking.created_at, Booking.id) < tuple_(cursor_created_at, before_id))
+        return query.order_by(
+            Booking.created_at.desc(), Booking.id.desc()
         ).limit(limit).all()
 
     def calculate_duration_days(self, booking_id):
         """Calculate booking duration in days."""
         booking = self.get_by_id(booking_id)
-        if booking:
-            return (booking.end_date - booking.start_date).days + 1
-        return 0
+        return booking.duration_days if booking else 0
 
     def calculate_total_revenue(self, owner_id):
         """Calculate total revenue from completed bookings for an owner's items."""
-        from app.models.item import Item
-
         # Check user exists and is verified
-        user = User.query.get(owner_id)
-        if not user or not getattr(user, 'is_verified', False):
+        if not _is_verified(owner_id):
             return 0
 
-        completed_bookings = Booking.query.join(Item).filter(
+        return db.session.query(
+            func.coalesce(func.sum(Booking.total_price), 0)
+        ).join(Item, Item.id == Booking.item_id).filter(
             Item.user_id == owner_id,
-            Booking.status == 'COMPLETED'
-        ).all()
+            Booking.status == BookingStatus.COMPLETED
+        ).scalar()
 
-        return sum(booking.total_price for booking in completed_bookings)
-
-    def get_booking_statistics(self, start_date=None, end_date=None):
-        query = Booking.query
+    @staticmethod
+    @cache.memoize(timeout=_CACHE_TIMEOUT)
+    def get_booking_statistics(start_date=None, end_date=None):
+        """Aggregate booking counts and revenue, cached per date range."""
+        query = db.session.query(
+            Booking.status,
+            func.count(Booking.id),
+            func.coalesce(func.sum(Booking.total_price), 0)
+        )
 
         if start_date:
             query = query.filter(Booking.created_at >= start_date)
         if end_date:
             query = query.filter(Booking.created_at <= end_date)
 
-        bookings = query.all()
+        # One row per status; the Enum column already yields BookingStatus members
+        by_status = {status: (count, revenue) for status, count, revenue in query.group_by(Booking.status)}
 
-        # Debug print
-        print("Booking statuses in statistics:")
-        for b in bookings:
-            print(f"Booking ID: {b.id}, Status: {b.status} ({type(b.status)})")
+        def _count(status):
+            return by_status.get(status, (0, 0))[0]
 
         return {
-            'total_bookings': len(bookings),
-            'pending_bookings': len([b for b in bookings if b.status and (b.status.value.upper() if hasattr(b.status, 'value') else str(b.status).upper()) == 'PENDING']),
-            'confirmed_bookings': len([b for b in bookings if b.status and (b.status.value.upper() if hasattr(b.status, 'value') else str(b.status).upper()) == 'CONFIRMED']),
-            'completed_bookings': len([b for b in bookings if b.status and (b.status.value.upper() if hasattr(b.status, 'value') else str(b.status).upper()) == 'COMPLETED']),
-            'cancelled_bookings': len([b for b in bookings if b.status and (b.status.value.upper() if hasattr(b.status, 'value') else str(b.status).upper()) == 'CANCELLED']),
-            'pastdue_bookings': len([b for b in bookings if b.status and (b.status.value.upper() if hasattr(b.status, 'value') else str(b.status).upper()) == 'PASTDUE']),
-            'returned_bookings': len([b for b in bookings if b.status and (b.status.value.upper() if hasattr(b.status, 'value') else str(b.status).upper()) == 'RETURNED']),
-            'total_revenue': sum(b.total_price for b in bookings if b.status and (b.status.value.upper() if hasattr(b.status, 'value') else str(b.status).upper()) == 'COMPLETED')
+            'total_bookings': sum(count for count, _ in by_status.values()),
+            'pending_bookings': _count(BookingStatus.PENDING),
+            'confirmed_bookings': _count(BookingStatus.CONFIRMED),
+            'completed_bookings': _count(BookingStatus.COMPLETED),
+            'cancelled_bookings': _count(BookingStatus.CANCELLED),
+            'pastdue_bookings': _count(BookingStatus.PASTDUE),
+            'returned_bookings': _count(BookingStatus.RETURNED),
+            'total_revenue': by_status.get(BookingStatus.COMPLETED, (0, 0))[1]
         }
 
+
+def _invalidate_cached_reads():
+    """Drop memoized booking listings after any booking write."""
+    cache.delete_memoized(BookingService.get_bookings_by_item)
+    cache.delete_memoized(BookingService.get_booking_statistics)
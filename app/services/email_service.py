@@ -3,9 +3,54 @@ Email service for WeRent Backend API.
 Handles sending verification emails and other email communications.
 """
 
-from flask import current_app, url_for
-from flask_mail import Message
-from app.extensions import mail
+import os
+from functools import lru_cache
+from flask import current_app, has_request_context, request, url_for
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from app.tasks.email_tasks import send_email_task
+
+# Domains of common email service providers
+_COMMON_EMAIL_PROVIDERS = frozenset({
+    'gmail.com', 'googlemail.com',
+    'outlook.com', 'hotmail.com', 'live.com', 'msn.com',
+    'yahoo.com', 'yahoo.co.uk', 'yahoo.ca', 'yahoo.co.in', 'yahoo.com.au',
+    'icloud.com', 'me.com', 'mac.com',
+    'protonmail.com', 'proton.me',
+    'aol.com',
+    'mail.com',
+    'yandex.com', 'yandex.ru',
+    'zoho.com',
+    'tutanota.com',
+    'fastmail.com'
+})
+
+# Email bodies live in app/templates/email and are compiled once at import;
+# each send only renders them. .html templates autoescape user-supplied
+# values, .txt ones do not. Templates ship with the code, so never re-stat.
+_templates = Environment(
+    loader=FileSystemLoader(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates', 'email')),
+    autoescape=select_autoescape(['html']),
+    auto_reload=False
+)
+
+_VERIFICATION_HTML = _templates.get_template('verification.html')
+_VERIFICATION_TEXT = _templates.get_template('verification.txt')
+_WELCOME_HTML = _templates.get_template('welcome.html')
+_WELCOME_TEXT = _templates.get_template('welcome.txt')
+
+# Stand-in path segment swapped for the real UUID in the cached verify URL
+_UUID_PLACEHOLDER = '__uuid__'
+
+
+@lru_cache(maxsize=16)
+def _verify_url_template(url_root):
+    """
+    Build the external verify-email URL once per host.
+
+    url_root only keys the cache, since _external URLs depend on the
+    requesting host; the URL itself comes from the normal url_for build.
+    """
+    return url_for('auth.verify_email', uuid=_UUID_PLACEHOLDER, _external=True)
 
 
 class EmailService:
@@ -22,27 +67,10 @@ class EmailService:
         Returns:
             bool: True if email is from a common provider, False otherwise
         """
-        if not email or '@' not in email:
+        if not email:
             return False
-            
-        domain = email.lower().split('@')[1]
-        
-        # List of common email service providers
-        common_providers = {
-            'gmail.com', 'googlemail.com',
-            'outlook.com', 'hotmail.com', 'live.com', 'msn.com',
-            'yahoo.com', 'yahoo.co.uk', 'yahoo.ca', 'yahoo.co.in', 'yahoo.com.au',
-            'icloud.com', 'me.com', 'mac.com',
-            'protonmail.com', 'proton.me',
-            'aol.com',
-            'mail.com',
-            'yandex.com', 'yandex.ru',
-            'zoho.com',
-            'tutanota.com',
-            'fastmail.com'
-        }
-        
-        return domain in common_providers
+        _, at, domain = email.rpartition('@')
+        return bool(at) and domain.lower() in _COMMON_EMAIL_PROVIDERS
 
     @staticmethod
     def _get_recipient_email(user_email):
@@ -63,7 +91,7 @@ class EmailService:
         else:
             # Only log if we have app context (when called from Flask app)
             try:
-                current_app.logger.info(f"Non-common email provider detected ({user_email}), using test bowl: {test_bowl}")
+                current_app.logger.info("Non-common email provider detected (%s), using test bowl: %s", user_email, test_bowl)
             except RuntimeError:
                 # Outside app context - likely testing scenario
                 pass
@@ -80,140 +108,38 @@ class EmailService:
             verification_uuid (str): UUID for email verification
         
         Returns:
-            bool: True if email sent successfully, False otherwise
+            bool: True if email was queued (or sent, when tasks run inline), False otherwise
         """
+        # Create verification URL
+        url_root = request.url_root if has_request_context() else current_app.config.get('SERVER_NAME')
+        verification_url = _verify_url_template(url_root).replace(_UUID_PLACEHOLDER, str(verification_uuid))
+
+        # Create email message
+        subject = "Welcome to WeRent - Please Verify Your Email"
+
+        # HTML email template
+        html_body = _VERIFICATION_HTML.render(user_name=user_name, verification_url=verification_url)
+
+        # Plain text version for email clients that don't support HTML
+        text_body = _VERIFICATION_TEXT.render(user_name=user_name, verification_url=verification_url)
+
+        # Use intelligent recipient selection: common email providers get original email,
+        # non-common providers get redirected to test bowl for testing
+        recipient_email = EmailService._get_recipient_email(user_email)
+
+        # Only the hand-off to the task queue can fail for reasons outside our code
         try:
-            # Create verification URL
-            verification_url = url_for(
-                'auth.verify_email', 
-                uuid=verification_uuid, 
-                _external=True
-            )
-            
-            # Create email message
-            subject = "Welcome to WeRent - Please Verify Your Email"
-            
-            # HTML email template
-            html_body = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="UTF-8">
-                <title>Email Verification - WeRent</title>
-                <style>
-                    body {{
-                        font-family: Arial, sans-serif;
-                        line-height: 1.6;
-                        color: #333;
-                        max-width: 600px;
-                        margin: 0 auto;
-                        padding: 20px;
-                    }}
-                    .header {{
-                        text-align: center;
-                        background-color: #4CAF50;
-                        color: white;
-                        padding: 20px;
-                        border-radius: 10px 10px 0 0;
-                    }}
-                    .content {{
-                        background-color: #f9f9f9;
-                        padding: 30px;
-                        border-radius: 0 0 10px 10px;
-                    }}
-                    .button {{
-                        display: inline-block;
-                        background-color: #4CAF50;
-                        color: white;
-                        padding: 12px 30px;
-                        text-decoration: none;
-                        border-radius: 5px;
-                        margin: 20px 0;
-                        font-weight: bold;
-                    }}
-                    .footer {{
-                        text-align: center;
-                        margin-top: 20px;
-                        color: #666;
-                        font-size: 12px;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="header">
-                    <h1>Welcome to WeRent!</h1>
-                </div>
-                <div class="content">
-                    <h2>Hello {user_name}!</h2>
-                    <p>Thank you for signing up with WeRent, your trusted equipment rental platform.</p>
-                    <p>To complete your registration and start renting amazing equipment, please verify your email address by clicking the button below:</p>
-                    
-                    <div style="text-align: center;">
-                        <a href="{verification_url}" class="button">Verify My Email Address</a>
-                    </div>
-                    
-                    <p>If the button doesn't work, you can also copy and paste this link into your browser:</p>
-                    <p><a href="{verification_url}">{verification_url}</a></p>
-                    
-                    <p><strong>Important:</strong> This verification link will expire in 24 hours for security reasons.</p>
-                    
-                    <p>If you didn't create an account with WeRent, please ignore this email.</p>
-                    
-                    <p>Best regards,<br>The WeRent Team</p>
-                </div>
-                <div class="footer">
-                    <p>© 2025 WeRent. All rights reserved.</p>
-                    <p>This is an automated email, please do not reply.</p>
-                </div>
-            </body>
-            </html>
-            """
-            
-            # Plain text version for email clients that don't support HTML
-            text_body = f"""
-            Welcome to WeRent!
-            
-            Hello {user_name}!
-            
-            Thank you for signing up with WeRent, your trusted equipment rental platform.
-            
-            To complete your registration and start renting amazing equipment, please verify your email address by visiting this link:
-            
-            {verification_url}
-            
-            Important: This verification link will expire in 24 hours for security reasons.
-            
-            If you didn't create an account with WeRent, please ignore this email.
-            
-            Best regards,
-            The WeRent Team
-            
-            © 2025 WeRent. All rights reserved.
-            This is an automated email, please do not reply.
-            """
-            
-            # Create and send message
-            # Use intelligent recipient selection: common email providers get original email,
-            # non-common providers get redirected to test bowl for testing
-            recipient_email = EmailService._get_recipient_email(user_email)
-            msg = Message(
-                subject=subject,
-                recipients=[recipient_email],
-                html=html_body,
-                body=text_body
-            )
-            
-            mail.send(msg)
-            if recipient_email != user_email:
-                current_app.logger.info(f"Verification email sent to test bowl {recipient_email} (original: {user_email})")
-            else:
-                current_app.logger.info(f"Verification email sent successfully to {recipient_email}")
-            return True
-            
+            send_email_task.delay(subject, [recipient_email], html_body, text_body)
         except Exception as e:
-            current_app.logger.error(f"Failed to send verification email to {user_email}: {str(e)}")
+            current_app.logger.error("Failed to send verification email to %s: %s", user_email, e)
             return False
 
+        if recipient_email != user_email:
+            current_app.logger.info("Verification email queued for test bowl %s (original: %s)", recipient_email, user_email)
+        else:
+            current_app.logger.info("Verification email queued for %s", recipient_email)
+        return True
+
     @staticmethod
     def send_welcome_email(user_email, user_name):
         """
@@ -224,133 +150,27 @@ class EmailService:
             user_name (str): User's full name
         
         Returns:
-            bool: True if email sent successfully, False otherwise
+            bool: True if email was queued (or sent, when tasks run inline), False otherwise
         """
+        subject = "Welcome to WeRent - Your Account is Ready!"
+
+        html_body = _WELCOME_HTML.render(user_name=user_name)
+
+        text_body = _WELCOME_TEXT.render(user_name=user_name)
+
+        # Use intelligent recipient selection: common email providers get original email,
+        # non-common providers get redirected to test bowl for testing
+        recipient_email = EmailService._get_recipient_email(user_email)
+
+        # Only the hand-off to the task queue can fail for reasons outside our code
         try:
-            subject = "Welcome to WeRent - Your Account is Ready!"
-            
-            html_body = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="UTF-8">
-                <title>Welcome to WeRent</title>
-                <style>
-                    body {{
-                        font-family: Arial, sans-serif;
-                        line-height: 1.6;
-                        color: #333;
-                        max-width: 600px;
-                        margin: 0 auto;
-                        padding: 20px;
-                    }}
-                    .header {{
-                        text-align: center;
-                        background-color: #4CAF50;
-                        color: white;
-                        padding: 20px;
-                        border-radius: 10px 10px 0 0;
-                    }}
-                    .content {{
-                        background-color: #f9f9f9;
-                        padding: 30px;
-                        border-radius: 0 0 10px 10px;
-                    }}
-                    .feature {{
-                        background-color: white;
-                        padding: 15px;
-                        margin: 10px 0;
-                        border-radius: 5px;
-                        border-left: 4px solid #4CAF50;
-                    }}
-                    .footer {{
-                        text-align: center;
-                        margin-top: 20px;
-                        color: #666;
-                        font-size: 12px;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="header">
-                    <h1>🎉 Welcome to WeRent!</h1>
-                </div>
-                <div class="content">
-                    <h2>Hello {user_name}!</h2>
-                    <p>Congratulations! Your email has been verified and your WeRent account is now active.</p>
-                    
-                    <h3>What you can do now:</h3>
-                    <div class="feature">
-                        <strong>📸 Browse Equipment</strong><br>
-                        Discover thousands of rental items from cameras to outdoor gear.
-                    </div>
-                    
-                    <div class="feature">
-                        <strong>📅 Make Bookings</strong><br>
-                        Reserve equipment for your next adventure or project.
-                    </div>
-                    
-                    <div class="feature">
-                        <strong>💰 List Your Items</strong><br>
-                        Earn money by renting out your own equipment.
-                    </div>
-                    
-                    <div class="feature">
-                        <strong>⭐ Leave Reviews</strong><br>
-                        Help the community by reviewing your rental experiences.
-                    </div>
-                    
-                    <p>Ready to get started? Log in to your account and explore what WeRent has to offer!</p>
-                    
-                    <p>If you have any questions, feel free to contact our support team.</p>
-                    
-                    <p>Happy renting!<br>The WeRent Team</p>
-                </div>
-                <div class="footer">
-                    <p>© 2025 WeRent. All rights reserved.</p>
-                </div>
-            </body>
-            </html>
-            """
-            
-            text_body = f"""
-            Welcome to WeRent!
-            
-            Hello {user_name}!
-            
-            Congratulations! Your email has been verified and your WeRent account is now active.
-            
-            What you can do now:
-            • Browse Equipment - Discover thousands of rental items
-            • Make Bookings - Reserve equipment for your adventures
-            • List Your Items - Earn money by renting out your equipment
-            • Leave Reviews - Help the community with your feedback
-            
-            Ready to get started? Log in to your account and explore what WeRent has to offer!
-            
-            Happy renting!
-            The WeRent Team
-            
-            © 2025 WeRent. All rights reserved.
-            """
-            
-            # Use intelligent recipient selection: common email providers get original email,
-            # non-common providers get redirected to test bowl for testing
-            recipient_email = EmailService._get_recipient_email(user_email)
-            msg = Message(
-                subject=subject,
-                recipients=[recipient_email],
-                html=html_body,
-                body=text_body
-            )
-            
-            mail.send(msg)
-            if recipient_email != user_email:
-                current_app.logger.info(f"Welcome email sent to test bowl {recipient_email} (original: {user_email})")
-            else:
-                current_app.logger.info(f"Welcome email sent successfully to {recipient_email}")
-            return True
-            
+            send_email_task.delay(subject, [recipient_email], html_body, text_body)
         except Exception as e:
-            current_app.logger.error(f"Failed to send welcome email to {user_email}: {str(e)}")
+            current_app.logger.error("Failed to send welcome email to %s: %s", user_email, e)
             return False
+
+        if recipient_email != user_email:
+            current_app.logger.info("Welcome email queued for test bowl %s (original: %s)", recipient_email, user_email)
+        else:
+            current_app.logger.info("Welcome email queued for %s", recipient_email)
+        return True
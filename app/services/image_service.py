@@ -3,8 +3,28 @@ Image service for business logic operations.
 Handles image management for items.
 """
 
+import re
+from sqlalchemy import select, update
 from app.services.base_service import BaseService
+from app.services.item_service import ItemService
 from app.models.image import Image
+from app.models.item import Item
+from app.extensions import db
+
+# Basic URL validation, compiled once for every validate_image_url call
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+# Accepted image suffixes; str.endswith checks the whole tuple in one call
+_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp')
+
+# ItemService keeps no per-call state, so one instance is shared by all calls
+_item_service = ItemService()
 
 
 class ImageService(BaseService):
@@ -14,12 +34,24 @@ class ImageService(BaseService):
         """Initialize ImageService."""
         super().__init__(Image)
 
+    def _get_image_and_owner(self, image_id):
+        """
+        Load an image and its item's owner ID in one query.
+
+        Returns (None, None) if the image does not exist; the owner ID is
+        None if the image's item is missing.
+        """
+        row = db.session.execute(
+            select(Image, Item.user_id)
+            .outerjoin(Item, Image.item_id == Item.id)
+            .where(Image.id == image_id)
+        ).first()
+        return tuple(row) if row else (None, None)
+
     def add_image_to_item(self, item_id, url, order=0):
         """Add a new image to an item."""
         # Verify item exists
-        from app.services.item_service import ItemService
-        item_service = ItemService()
-        item = item_service.get_by_id(item_id)
+        item = _item_service.get_by_id(item_id)
 
         if not item:
             raise ValueError("Item not found")
@@ -51,62 +83,66 @@ class ImageService(BaseService):
 
     def reorder_images(self, item_id, image_order_list):
         """Reorder all images for an item based on list of image IDs."""
-        # image_order_list should be a list of image IDs in the desired order
-        for index, image_id in enumerate(image_order_list, 1):
-            image = self.get_by_id(image_id)
-            if image and image.item_id == item_id:
-                image.order = index
-                self.save(image)
+        # image_order_list should be a list of image IDs in the desired order;
+        # IDs that are unknown or belong to another item keep their slot but are skipped
+        owned = set(db.session.scalars(
+            select(Image.id).where(Image.id.in_(image_order_list), Image.item_id == item_id)
+        ))
+        mappings = [
+            {'id': image_id, 'order': index}
+            for index, image_id in enumerate(image_order_list, 1)
+            if image_id in owned
+        ]
+        if mappings:
+            with self.batch():
+                db.session.execute(update(Image), mappings)
 
     def delete_image(self, image_id, user_id):
         """Delete an image (only by item owner)."""
-        image = self.get_by_id(image_id)
+        image, owner_id = self._get_image_and_owner(image_id)
         if not image:
             return None
 
         # Check if user is the owner of the item
-        from app.services.item_service import ItemService
-        item_service = ItemService()
-        item = item_service.get_by_id(image.item_id)
-
-        if not item or item.owner_id != user_id:
+        if owner_id is None or owner_id != user_id:
             raise ValueError("You can only delete images from your own items")
 
-        self.delete(image)
+        with self.batch():
+            self.delete(image)
 
-        # Reorder remaining images to close gaps
-        remaining_images = self.get_images_by_item(image.item_id)
-        for index, img in enumerate(remaining_images, 1):
-            if img.order != index:
-                img.order = index
-                self.save(img)
+            # Reorder remaining images to close gaps, in one executemany UPDATE
+            remaining_images = self.get_images_by_item(image.item_id)
+            mappings = [
+                {'id': img.id, 'order': index}
+                for index, img in enumerate(remaining_images, 1)
+                if img.order != index
+            ]
+            if mappings:
+                db.session.execute(update(Image), mappings)
 
         return True
 
     def set_primary_image(self, image_id, user_id):
         """Set an image as the primary image (order = 1) for an item."""
-        image = self.get_by_id(image_id)
+        image, owner_id = self._get_image_and_owner(image_id)
         if not image:
             return None
 
         # Check if user is the owner of the item
-        from app.services.item_service import ItemService
-        item_service = ItemService()
-        item = item_service.get_by_id(image.item_id)
-
-        if not item or item.owner_id != user_id:
+        if owner_id is None or owner_id != user_id:
             raise ValueError("You can only modify images from your own items")
 
         # Get current primary image
         current_primary = Image.query.filter_by(item_id=image.item_id, order=1).first()
 
-        if current_primary and current_primary.id != image.id:
-            # Swap orders
-            current_primary.order = image.order
-            self.save(current_primary)
+        with self.batch():
+            if current_primary and current_primary.id != image.id:
+                # Swap orders
+                current_primary.order = image.order
+                self.save(current_primary)
 
-        image.order = 1
-        return self.save(image)
+            image.order = 1
+            return self.save(image)
 
     def get_primary_image(self, item_id):
         """Get the primary image (order = 1) for an item."""
@@ -118,23 +154,11 @@ class ImageService(BaseService):
 
     def validate_image_url(self, url):
         """Validate image URL format."""
-        import re
-
-        # Basic URL validation
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-
-        if not url_pattern.match(url):
+        if not _URL_RE.match(url):
             raise ValueError("Invalid URL format")
 
         # Check if URL ends with image extension
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp']
-        if not any(url.lower().endswith(ext) for ext in image_extensions):
+        if not url.lower().endswith(_IMAGE_EXTENSIONS):
             raise ValueError("URL must point to an image file")
 
         return True
@@ -142,44 +166,33 @@ class ImageService(BaseService):
     def bulk_add_images(self, item_id, image_urls):
         """Add multiple images to an item at once."""
         # Verify item exists
-        from app.services.item_service import ItemService
-        item_service = ItemService()
-        item = item_service.get_by_id(item_id)
+        item = _item_service.get_by_id(item_id)
 
         if not item:
             raise ValueError("Item not found")
 
-        # Get the current highest order
-        max_order = Image.query.filter_by(item_id=item_id).order_by(Image.order.desc()).first()
-        current_order = (max_order.order if max_order else 0)
-
-        created_images = []
+        # Validate every URL before writing anything
         for url in image_urls:
-            # Validate each URL
             self.validate_image_url(url)
 
-            current_order += 1
-            image = Image()
-            image.item_id = item_id
-            image.url = url
-            image.order = current_order
-
-            created_images.append(self.save(image))
+        # Get the current highest order
+        max_order = Image.query.filter_by(item_id=item_id).order_by(Image.order.desc()).first()
+        current_order = (max_order.order if max_order else 0)
 
-        return created_images
+        # One batched INSERT and a single commit for the whole list
+        return self.bulk_create([
+            {'item_id': item_id, 'url': url, 'order': current_order + index}
+            for index, url in enumerate(image_urls, 1)
+        ])
 
     def update_image_url(self, image_id, new_url, user_id):
         """Update image URL."""
-        image = self.get_by_id(image_id)
+        image, owner_id = self._get_image_and_owner(image_id)
         if not image:
             return None
 
         # Check if user is the owner of the item
-        from app.services.item_service import ItemService
-        item_service = ItemService()
-        item = item_service.get_by_id(image.item_id)
-
-        if not item or item.owner_id != user_id:
+        if owner_id is None or owner_id != user_id:
             raise ValueError("You can only modify images from your own items")
 
         # Validate new URL
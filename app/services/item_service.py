@@ -3,10 +3,18 @@ Item service for business logic operations.
 Handles item management, availability, and item-related operations.
 """
 
+from flask import current_app
+from sqlalchemy.orm import selectinload
 from app.services.base_service import BaseService
 from app.models.item import Item
 from app.models.image import Image
-from app.extensions import db
+from app.extensions import db, cache
+
+# Home-page listings are global and may lag writes by a couple of minutes
+_LISTING_CACHE_TIMEOUT = 120
+
+# Item.to_dict renders every image; load them with one SELECT ... IN per query
+_WITH_IMAGES = selectinload(Item.images)
 
 
 class ItemService(BaseService):
@@ -27,20 +35,16 @@ class ItemService(BaseService):
         Returns:
             list: List of saved image objects
         """
-        saved_images = []
-        for img in images:
-            # Ensure the image has the data URL prefix
-            if not img.startswith('data:image'):
-                img = f'data:image/jpeg;base64,{img}'
-                
-            # Create and save the image
-            image = Image(
-                image_base64=img,
+        saved_images = [
+            Image(
+                # Ensure the image has the data URL prefix
+                image_base64=img if img.startswith('data:image') else f'data:image/jpeg;base64,{img}',
                 item_id=item_id
             )
-            db.session.add(image)
-            saved_images.append(image)
-            
+            for img in images
+        ]
+        # add_all lets the flush batch the INSERTs; one commit for the list
+        db.session.add_all(saved_images)
         db.session.commit()
         return saved_images
         
@@ -86,28 +90,49 @@ class ItemService(BaseService):
         if images:
             self.save_item_images(item.id, images)
             
-        # Refresh the item to include the images in the response
-        db.session.refresh(item)
+        # Reload the item with its images for the response
+        item = self._reload_with_images(item.id)
+        _invalidate_item_listings()
         return item
 
-    def get_available_items(self):
-        """Get all items (status filter removed)."""
-        return Item.query.all()
+    def _reload_with_images(self, item_id):
+        """Re-read an item and its images, overwriting any stale session state."""
+        return db.session.scalars(
+            db.select(Item).options(_WITH_IMAGES).where(Item.id == item_id)
+            .execution_options(populate_existing=True)
+        ).one()
+
+    @staticmethod
+    def _page(query, page, per_page):
+        """
+        Limit a query to one page, ordered by ID.
+
+        page defaults to 1 and per_page to ITEMS_PER_PAGE, clamped to
+        MAX_ITEMS_PER_PAGE, so listings never load the whole table.
+        """
+        page = max(page or 1, 1)
+        per_page = min(max(per_page or current_app.config['ITEMS_PER_PAGE'], 1),
+                       current_app.config['MAX_ITEMS_PER_PAGE'])
+        return query.order_by(Item.id).limit(per_page).offset((page - 1) * per_page).all()
+
+    def get_available_items(self, page=1, per_page=None):
+        """Get one page of items (status filter removed)."""
+        return self._page(Item.query.options(_WITH_IMAGES), page, per_page)
 
     def get_items_by_owner(self, user_id):
         """Get all items owned by a specific user."""
-        return Item.query.filter_by(user_id=user_id).all()
+        return Item.query.options(_WITH_IMAGES).filter_by(user_id=user_id).all()
 
     def get_items_by_category(self, category):
         """Get items by category."""
         return Item.query.filter_by(category=category).all()
 
-    def search_items(self, query):
-        """Search items by title or description."""
-        return Item.query.filter(
-            (Item.title.ilike(f'%{query}%')) |
+    def search_items(self, query, page=1, per_page=None):
+        """Search items by name or description, one page at a time."""
+        return self._page(Item.query.options(_WITH_IMAGES).filter(
+            (Item.name.ilike(f'%{query}%')) |
             (Item.description.ilike(f'%{query}%'))
-        ).all()
+        ), page, per_page)
 
 
     def mark_as_rented(self, item_id):
@@ -123,59 +148,118 @@ class ItemService(BaseService):
         return self.update_item_status(item_id, 'maintenance')
 
     def is_item_available(self, item_id):
-        """Check if item is available for booking."""
-        item = self.get_by_id(item_id)
-        return item and item.status == 'available'
+        """Check if item exists and can be booked."""
+        from sqlalchemy import exists
+
+        # Items have no status column; per-date availability comes from bookings
+        return db.session.query(exists().where(Item.id == item_id)).scalar()
 
     def calculate_item_rating(self, item_id):
         """Calculate average rating for an item."""
-        item = self.get_by_id(item_id)
-        if not item or not item.reviews:
-            return 0.0
+        from sqlalchemy import func
+        from app.models.review import Review
 
-        total_rating = sum(review.rating for review in item.reviews)
-        return round(total_rating / len(item.reviews), 2)
+        # AVG over no rows is NULL, which covers both a missing item and no reviews
+        average = db.session.query(func.avg(Review.rating)).filter(Review.item_id == item_id).scalar()
+        return round(float(average), 2) if average is not None else 0.0
 
     def get_item_stats(self, item_id):
         """Get item statistics."""
+        from sqlalchemy import func, select
+        from app.models.booking import Booking
+        from app.models.review import Review
+
         item = self.get_by_id(item_id)
         if not item:
             return None
 
+        # Count each collection in SQL instead of loading it, all in one round-trip
+        def _for_item(column, model):
+            return select(column).where(model.item_id == item_id).scalar_subquery()
+
+        total_bookings, total_reviews, average_rating, total_images = db.session.execute(select(
+            _for_item(func.count(Booking.id), Booking),
+            _for_item(func.count(Review.id), Review),
+            _for_item(func.avg(Review.rating), Review),
+            _for_item(func.count(Image.id), Image)
+        )).one()
+
         return {
-            'total_bookings': len(item.bookings),
-            'total_reviews': len(item.reviews),
-            'average_rating': self.calculate_item_rating(item_id),
-            'total_images': len(item.images),
-            'status': item.status,
+            'total_bookings': total_bookings,
+            'total_reviews': total_reviews,
+            'average_rating': round(float(average_rating), 2) if average_rating is not None else 0.0,
+            'total_images': total_images,
             'created_at': item.created_at.isoformat()
         }
 
+    def _items_in_order(self, item_ids):
+        """Load items and their images by ID, keeping the given order."""
+        if not item_ids:
+            return []
+        items = db.session.scalars(
+            db.select(Item).options(_WITH_IMAGES).where(Item.id.in_(item_ids))
+        )
+        items_by_id = {item.id: item for item in items}
+        # Items deleted since the IDs were cached are simply skipped
+        return [items_by_id[item_id] for item_id in item_ids if item_id in items_by_id]
+
+    @staticmethod
+    @cache.memoize(timeout=_LISTING_CACHE_TIMEOUT)
+    def _popular_item_ids(limit):
+        """IDs of the most-booked items, cached until the next booking."""
+        # items.booking_count is kept in step by BookingService.create_booking,
+        # so the top N comes straight off ix_items_booking_count
+        return db.session.scalars(
+            db.select(Item.id).where(Item.booking_count > 0).order_by(
+                Item.booking_count.desc(), Item.id
+            ).limit(limit)
+        ).all()
+
+    @staticmethod
+    @cache.memoize(timeout=_LISTING_CACHE_TIMEOUT)
+    def _top_rated_item_ids(limit):
+        """IDs of the best-rated items, cached until the next rating change."""
+        # items.rating is kept in step with reviews by ReviewService; ratings
+        # are 1-5, so a zero rating means the item has no reviews
+        return db.session.scalars(
+            db.select(Item.id).where(Item.rating > 0).order_by(
+                Item.rating.desc(), Item.id
+            ).limit(limit)
+        ).all()
+
+    @staticmethod
+    @cache.memoize(timeout=_LISTING_CACHE_TIMEOUT)
+    def _recent_item_ids(limit):
+        """IDs of the newest items, cached until the next item is created."""
+        return db.session.scalars(
+            db.select(Item.id).order_by(Item.created_at.desc()).limit(limit)
+        ).all()
+
+    @staticmethod
+    def invalidate_popular_items():
+        """Drop the cached popular listing; call after creating bookings."""
+        cache.delete_memoized(ItemService._popular_item_ids)
+
+    @staticmethod
+    def invalidate_top_rated_items():
+        """Drop the cached top-rated listing; call after item ratings change."""
+        cache.delete_memoized(ItemService._top_rated_item_ids)
+
     def get_popular_items(self, limit=10):
         """Get most popular items based on booking count."""
-        from sqlalchemy import func
-        from app.models.booking import Booking
-
-        return Item.query.join(Booking).group_by(Item.id).order_by(
-            func.count(Booking.id).desc()
-        ).limit(limit).all()
+        return self._items_in_order(ItemService._popular_item_ids(limit))
 
     def get_top_rated_items(self, limit=10):
         """Get top rated items."""
-        from sqlalchemy import func
-        from app.models.review import Review
-
-        return Item.query.join(Review).group_by(Item.id).order_by(
-            func.avg(Review.rating).desc()
-        ).limit(limit).all()
+        return self._items_in_order(ItemService._top_rated_item_ids(limit))
 
     def get_recently_added_items(self, limit=10):
         """Get recently added items."""
-        return Item.query.order_by(Item.created_at.desc()).limit(limit).all()
+        return self._items_in_order(ItemService._recent_item_ids(limit))
 
-    def filter_items(self, category=None, min_price=None, max_price=None, status='available'):
-        """Filter items by various criteria."""
-        query = Item.query
+    def filter_items(self, category=None, min_price=None, max_price=None, status='available', page=1, per_page=None):
+        """Filter items by various criteria, one page at a time."""
+        query = Item.query.options(_WITH_IMAGES)
 
 
         if category:
@@ -187,11 +271,11 @@ class ItemService(BaseService):
         if max_price is not None:
             query = query.filter(Item.price_per_day <= max_price)
 
-        return query.all()
+        return self._page(query, page, per_page)
 
     def get_item_availability_calendar(self, item_id, start_date, end_date):
         """Get item availability for a date range."""
-        from app.models.booking import Booking
+        from app.models.booking import Booking, BookingStatus
 
         item = self.get_by_id(item_id)
         if not item:
@@ -200,7 +284,7 @@ class ItemService(BaseService):
         # Get all confirmed bookings for this item in the date range
         conflicting_bookings = Booking.query.filter(
             Booking.item_id == item_id,
-            Booking.status == 'confirmed',
+            Booking.status == BookingStatus.CONFIRMED,
             Booking.start_date <= end_date,
             Booking.end_date >= start_date
         ).all()
@@ -241,9 +325,17 @@ class ItemService(BaseService):
         
         updated_item = self.update(item, **update_data)
         if updated_item:
-            # Refresh to include the updated images in the response
-            db.session.refresh(updated_item)
+            # Reload to include the updated images in the response
+            updated_item = self._reload_with_images(updated_item.id)
+            _invalidate_item_listings()
         return updated_item
+
+    def delete_item(self, item_id):
+        """Delete an item; returns the deleted item, or None if not found."""
+        item = self.delete_by_id(item_id)
+        if item is not None:
+            _invalidate_item_listings()
+        return item
         
     def update_item_details(self, item_id, **kwargs):
         """
@@ -253,7 +345,9 @@ class ItemService(BaseService):
         """
         return self.update_item(item_id, **kwargs)
 
-    def get_categories_with_counts(self):
+    @staticmethod
+    @cache.memoize(timeout=_LISTING_CACHE_TIMEOUT)
+    def get_categories_with_counts():
         """Get all categories with item counts."""
         from sqlalchemy import func
 
@@ -263,3 +357,11 @@ class ItemService(BaseService):
         ).group_by(Item.category).all()
 
         return [{'category': cat, 'count': count} for cat, count in result]
+
+
+def _invalidate_item_listings():
+    """Drop cached listings after an item is created, updated or deleted."""
+    cache.delete_memoized(ItemService._recent_item_ids)
+    cache.delete_memoized(ItemService._popular_item_ids)
+    cache.delete_memoized(ItemService._top_rated_item_ids)
+    cache.delete_memoized(ItemService.get_categories_with_counts)
@@ -1,8 +1,10 @@
 from app.models.payment import Payment, PaymentMethod, PaymentType
 from app.extensions import db
+from sqlalchemy import update
 from typing import List, Optional
-from app.models.booking import Booking
+from app.models.booking import Booking, BookingStatus
 from app.models.user import User
+from app.services.booking_service import BookingService
 
 class PaymentService:
     @staticmethod
@@ -13,13 +15,13 @@ class PaymentService:
             if not user or not getattr(user, 'is_verified', False):
                 return None
 
-        # Check all booking_ids exist and belong to user (if user_id provided)
-        for bid in booking_id:
-            booking = Booking.query.get(bid)
-            if not booking:
-                return None
-            if user_id is not None and str(booking.user_id) != str(user_id):
-                return None
+        # Check all booking_ids exist and belong to user (if user_id provided),
+        # loading them with a single IN query
+        bookings = Booking.query.filter(Booking.id.in_(booking_id)).all()
+        if len(bookings) != len(set(booking_id)):
+            return None
+        if user_id is not None and any(str(booking.user_id) != str(user_id) for booking in bookings):
+            return None
 
         try:
             # Create payment record
@@ -32,22 +34,23 @@ class PaymentService:
             )
             db.session.add(payment)
             
-            # Update all associated bookings to PAID status
-            for bid in booking_id:
-                booking = Booking.query.get(bid)
-                if booking:
-                    booking.status = 'PAID'
-                    booking.is_paid = True
-                    db.session.add(booking)
+            # Update all associated bookings to PAID status in one UPDATE
+            db.session.execute(
+                update(Booking)
+                .where(Booking.id.in_(booking_id))
+                .values(status=BookingStatus.PAID, is_paid=True)
+            )
             
             db.session.commit()
-            return payment
-            
         except Exception as e:
             db.session.rollback()
             print(f"Error creating payment: {str(e)}")
             return None
 
+        # The bulk UPDATE bypassed BookingService, so drop its cached listings
+        BookingService.invalidate_cached_reads()
+        return payment
+
     @staticmethod
     def get_payment(payment_id: int) -> Optional[Payment]:
         return db.session.get(Payment, payment_id)
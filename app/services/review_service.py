@@ -7,9 +7,8 @@ from ast import Str
 from app.services.base_service import BaseService
 from app.models.review import Review
 from app.services.item_service import ItemService
-from app.services.user_service import UserService
 from app.models.image import Image
-from app.models.booking import Booking
+from app.models.booking import Booking, BookingStatus
 from app.extensions import db
 from app.models.item import Item
 
@@ -31,24 +30,32 @@ class ReviewService(BaseService):
         if not self.is_valid_rating(rating):
             raise ValueError("Rating must be between 1 and 5")
 
+        # Fetch the item's owner, the duplicate-review check and the user
+        # existence check in one round trip
+        from sqlalchemy import select
+        from app.models.user import User
+
+        row = db.session.execute(
+            select(
+                Item.user_id,
+                select(Review.id).where(
+                    Review.user_id == user_id, Review.item_id == item_id
+                ).exists(),
+                select(User.id).where(User.id == user_id).exists(),
+            ).where(Item.id == item_id)
+        ).first()
+        if row is None:
+            raise ValueError("Item not found")
+        owner_id, already_reviewed, user_exists = row
+
         # Check if user has already reviewed this item
-        existing_review = self.get_user_review_for_item(user_id, item_id)
-        if existing_review:
+        if already_reviewed:
             raise ValueError("You have already reviewed this item")
-
-        # Verify item and user exist
-        item_service = ItemService()
-        user_service = UserService()
-
-        item = item_service.get_by_id(item_id)
-        user = user_service.get_by_id(user_id)
-        if not item:
-            raise ValueError("Item not found")
-        if not user:
+        if not user_exists:
             raise ValueError("User not found")
 
         # Check if user is trying to review their own item
-        if item.user_id == user_id:
+        if owner_id == user_id:
             raise ValueError("You cannot review your own item")
 
         review = Review()
@@ -64,27 +71,15 @@ class ReviewService(BaseService):
 
         # Handle images
         if images:
-            for img_b64 in images:
-                image = Image(image_base64=img_b64, review_id=review.id)
-                db.session.add(image)
-                if not review.images:
-                    review.images = []
-                review.images.append(image)
-        
-        # Commit the review and its images
+            self._insert_review_images(review.id, images)
+
+        # Update item's rating, then commit it with the review and its images
+        self._update_item_rating(item_id)
         db.session.commit()
-        
-        # Now refresh the item to get the latest reviews
-        db.session.refresh(item)
-        
-        # Update item's rating and owner's average rating
-        item.update_rating()
-        self.update_owner_rating(item.user_id)
-        
-        # Get the saved review with relationships loaded
-        saved_review = self.get_by_id(review.id)
+        ItemService.invalidate_top_rated_items()
 
-        return saved_review
+        # The review is still in the session; its attributes reload on access
+        return review
 
     def update_review(self, review_id, user_id, rating=None, comment=None, images=None):
         """Update an existing review, including images if provided."""
@@ -104,66 +99,47 @@ class ReviewService(BaseService):
 
         # Handle image update: if images provided, replace all
         if images is not None:
-            # Delete old images
-            for img in list(review.images):
-                db.session.delete(img)
-            review.images = []
+            # Delete old images; the commit below expires review.images
+            self._delete_review_images(review.id)
             # Add new images
-            for img_b64 in images:
-                image = Image(image_base64=img_b64, review_id=review.id)
-                db.session.add(image)
-                review.images.append(image)
-        
+            if images:
+                self._insert_review_images(review.id, images)
+
+
         # Save changes
         db.session.add(review)
+
+        # Only update the item's rating if the rating actually changed
+        if old_rating != rating:
+            db.session.flush()
+            self._update_item_rating(review.item_id)
         db.session.commit()
-        
-        # Only update ratings if the rating actually changed
         if old_rating != rating:
-            # Refresh the item to get the latest reviews
-            db.session.refresh(review.item)
-            # Update item's rating and owner's average rating
-            review.item.update_rating()
-            self.update_owner_rating(review.item.user_id)
-        
-        # Get the saved review with relationships loaded
-        saved_review = self.get_by_id(review.id)
-        return saved_review
+            ItemService.invalidate_top_rated_items()
+
+        return review
 
     def delete_review(self, review_id, user_id):
         """Delete a review and update the item's rating."""
-        # Get the review with its item relationship loaded
-        review = (
-            db.session.query(Review)
-            .options(db.joinedload(Review.item))
-            .filter_by(id=review_id)
-            .first()
-        )
-        
+        review = db.session.get(Review, review_id)
         if not review:
             return None
 
         if str(review.user_id) != str(user_id):
             raise ValueError("You can only delete your own reviews")
 
-        # Store the item and owner ID before deletion
-        item = review.item
-        owner_id = item.user_id
-        
+        # Store the item ID before deletion
+        item_id = review.item_id
+
         # Delete the review and its images
-        for img in list(review.images):
-            db.session.delete(img)
+        self._delete_review_images(review.id)
         db.session.delete(review)
+        db.session.flush()
+
+        # Update the item's rating in the same transaction
+        self._update_item_rating(item_id)
         db.session.commit()
-        
-        # Get a fresh copy of the item to ensure we have the latest state
-        fresh_item = db.session.get(Item, item.id)
-        
-        # Update the item's rating
-        fresh_item.update_rating()
-        
-        # Update the owner's average rating
-        self.update_owner_rating(owner_id)
+        ItemService.invalidate_top_rated_items()
         
         return True
 
@@ -186,9 +162,15 @@ class ReviewService(BaseService):
         return query.all()
 
     def get_user_review_for_item(self, user_id, item_id):
-        """Check if user has reviewed a specific item."""
+        """Get the user's review of a specific item, if any."""
         return Review.query.filter_by(user_id=user_id, item_id=item_id).first()
 
+    def has_user_reviewed_item(self, user_id, item_id):
+        """Check if user has reviewed a specific item without loading the review."""
+        return db.session.query(
+            Review.query.filter_by(user_id=user_id, item_id=item_id).exists()
+        ).scalar()
+
     def get_item_average_rating(self, item_id):
         """Calculate average rating for an item."""
         from sqlalchemy import func
@@ -215,22 +197,40 @@ class ReviewService(BaseService):
         """Get reviews with highest ratings."""
         return Review.query.order_by(Review.rating.desc(), Review.created_at.desc()).limit(limit).all()
 
-    def update_owner_rating(self, owner_id):
-        """Update the average rating for an item owner."""
-        from sqlalchemy import func
-        from app.services.user_service import UserService
+    def _insert_review_images(self, review_id, images):
+        """Insert a review's images in one executemany INSERT."""
+        from sqlalchemy import insert
 
-        # Get average rating from all reviews of items owned by this user
-        result = Review.query.join(Item).filter(
-            Item.user_id == owner_id
-        ).with_entities(func.avg(Review.rating)).first()
+        db.session.execute(
+            insert(Image),
+            [{'image_base64': img_b64, 'review_id': review_id} for img_b64 in images]
+        )
 
-        user_service = UserService()
-        user = user_service.get_by_id(owner_id)
+    def _delete_review_images(self, review_id):
+        """Delete all of a review's images in one DELETE."""
+        from sqlalchemy import delete
 
-        if user:
-            user.avg_rating = round(result[0], 2) if result[0] else 0.0
-            user_service.save(user)
+        db.session.execute(
+            delete(Image).where(Image.review_id == review_id)
+            .execution_options(synchronize_session=False)
+        )
+
+    def _update_item_rating(self, item_id):
+        """
+        Recompute an item's rating from its reviews with one UPDATE.
+
+        Does not commit; callers flush their review changes first and commit
+        the rating together with them.
+        """
+        from sqlalchemy import func, select, update
+
+        average = select(
+            func.coalesce(func.avg(Review.rating), 0.0)
+        ).where(Review.item_id == item_id).scalar_subquery()
+        db.session.execute(
+            update(Item).where(Item.id == item_id).values(rating=average)
+            .execution_options(synchronize_session=False)
+        )
 
     def get_review_statistics(self, item_id=None, user_id=None):
         """Get review statistics for an item or user."""
@@ -245,43 +245,39 @@ class ReviewService(BaseService):
             from app.models.item import Item
             query = query.join(Item).filter(Item.user_id == user_id)
 
-        stats = query.with_entities(
-            func.count(Review.id).label('total_reviews'),
-            func.avg(Review.rating).label('avg_rating'),
-            func.min(Review.rating).label('min_rating'),
-            func.max(Review.rating).label('max_rating')
-        ).first()
-
-        # Get rating distribution
-        rating_distribution = {}
-        for rating in range(1, 6):
-            count = query.filter(Review.rating == rating).count()
-            rating_distribution[f'{rating}_star'] = count
+        # One row per distinct rating; every other figure derives from these buckets
+        counts = dict(
+            query.with_entities(Review.rating, func.count(Review.id)).group_by(Review.rating).all()
+        )
+        total_reviews = sum(counts.values())
+        average_rating = sum(rating * count for rating, count in counts.items()) / total_reviews if total_reviews else None
 
         return {
-            'total_reviews': stats.total_reviews,
-            'average_rating': round(stats.avg_rating, 2) if stats.avg_rating else 0.0,
-            'min_rating': stats.min_rating,
-            'max_rating': stats.max_rating,
-            'rating_distribution': rating_distribution
+            'total_reviews': total_reviews,
+            'average_rating': round(average_rating, 2) if average_rating else 0.0,
+            'min_rating': min(counts) if counts else None,
+            'max_rating': max(counts) if counts else None,
+            'rating_distribution': {f'{rating}_star': counts.get(rating, 0) for rating in range(1, 6)}
         }
 
     def can_user_review_item(self, user_id, item_id):
         """Check if user can review an item (has completed booking, hasn't reviewed yet)."""
 
-        # Check if user has completed a booking for this item
-        completed_booking = Booking.query.filter_by(
-            user_id=user_id,
-            item_id=item_id,
-            status='completed'
-        ).first()
-
-        if not completed_booking:
+        # Check if user has completed a booking for this item; EXISTS only
+        # answers yes/no instead of loading the booking row
+        has_completed_booking = db.session.query(
+            Booking.query.filter_by(
+                user_id=user_id,
+                item_id=item_id,
+                status=BookingStatus.COMPLETED
+            ).exists()
+        ).scalar()
+
+        if not has_completed_booking:
             return False, "You can only review items you have rented and completed"
 
         # Check if user hasn't already reviewed this item
-        existing_review = self.get_user_review_for_item(user_id, item_id)
-        if existing_review:
+        if self.has_user_reviewed_item(user_id, item_id):
             return False, "You have already reviewed this item"
 
         # Check if user is not the owner
@@ -52,6 +52,22 @@ def get_item_paths():
                 "tags": ["Item"],
                 "summary": "List all available items",
                 "security": [{"BearerAuth": []}],
+                "parameters": [
+                    {
+                        "name": "page",
+                        "in": "query",
+                        "required": False,
+                        "schema": {"type": "integer", "default": 1, "minimum": 1},
+                        "description": "Page number (default: 1)"
+                    },
+                    {
+                        "name": "per_page",
+                        "in": "query",
+                        "required": False,
+                        "schema": {"type": "integer", "default": 20, "maximum": 100},
+                        "description": "Items per page (default: 20, max: 100)"
+                    }
+                ],
                 "responses": {
                     "200": {
                         "description": "List of items",
@@ -1657,6 +1673,22 @@ def get_booking_paths():
                 "tags": ["Booking"],
                 "summary": "List all bookings in the system",
                 "security": [{"BearerAuth": []}],
+                "parameters": [
+                    {
+                        "name": "page",
+                        "in": "query",
+                        "required": False,
+                        "schema": {"type": "integer", "default": 1, "minimum": 1},
+                        "description": "Page number (admin only; default: 1)"
+                    },
+                    {
+                        "name": "per_page",
+                        "in": "query",
+                        "required": False,
+                        "schema": {"type": "integer", "default": 20, "maximum": 100},
+                        "description": "Bookings per page (admin only; default: 20, max: 100)"
+                    }
+                ],
                 "responses": {
                     "200": {
                         "description": "List of all bookings",
@@ -1949,6 +1981,13 @@ def get_booking_paths():
                         "required": False, 
                         "schema": {"type": "integer", "default": 20},
                         "description": "Maximum number of bookings to return (default: 20)"
+                    },
+                    {
+                        "name": "before_id",
+                        "in": "query",
+                        "required": False,
+                        "schema": {"type": "integer"},
+                        "description": "Return bookings older than this booking ID (ID of the last booking on the previous page)"
                     }
                 ],
                 "responses": {
@@ -3,6 +3,8 @@ Simplified Swagger UI integration for WeRent Backend API.
 Uses modular approach with separate files for configuration, schemas, and paths.
 """
 
+from functools import lru_cache
+
 from flask import Blueprint, jsonify
 
 from .server_config import get_server_urls, get_api_info, get_security_schemes, get_tags
@@ -13,8 +15,14 @@ from .paths import get_all_paths
 swagger_bp = Blueprint("swagger", __name__, url_prefix="/docs")
 
 
+@lru_cache(maxsize=1)
 def get_openapi_spec():
-    """Generate comprehensive OpenAPI 3.0 specification for the API."""
+    """
+    Generate comprehensive OpenAPI 3.0 specification for the API.
+
+    The spec only depends on static definitions and process environment, so
+    it is built once per process and reused by every /swagger.json request.
+    """
     return {
         "openapi": "3.0.0",
         "info": get_api_info(),
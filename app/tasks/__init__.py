@@ -0,0 +1,12 @@
+"""
+Background tasks for WeRent Backend API.
+Tasks run on the Celery worker (or inline when no broker is configured).
+"""
+
+from .email_tasks import send_email_task
+from .booking_tasks import expire_pending_bookings_task
+
+__all__ = [
+    'send_email_task',
+    'expire_pending_bookings_task'
+]
@@ -0,0 +1,13 @@
+"""
+Booking maintenance tasks.
+Scheduled by Celery beat (see CELERY['beat_schedule'] in config).
+"""
+
+from celery import shared_task
+from app.services.booking_service import BookingService
+
+
+@shared_task(ignore_result=True)
+def expire_pending_bookings_task():
+    """Cancel PENDING bookings whose reservation window has lapsed."""
+    return BookingService.expire_pending_bookings()
@@ -0,0 +1,95 @@
+"""
+Email delivery tasks.
+Moves the SMTP round-trip off the request thread.
+"""
+
+from smtplib import SMTPException, SMTPServerDisconnected
+from celery import shared_task
+from celery.signals import worker_process_init, worker_process_shutdown
+from flask_mail import Message
+from app.extensions import mail
+
+# SMTP session kept open across tasks so each email skips the
+# connect/STARTTLS/AUTH handshake. Only prefork worker processes, which run
+# one task at a time, reuse it; tasks run inline on request threads (no
+# broker) open a connection per email so threads never share a socket.
+_connection = None
+_reuse_connection = False
+
+
+@worker_process_init.connect
+def _enable_connection_reuse(**kwargs):
+    global _reuse_connection
+    _reuse_connection = True
+
+
+def _get_connection():
+    """Return the process-wide SMTP connection, opening it if needed."""
+    global _connection
+    if _connection is None:
+        _connection = mail.connect().__enter__()
+    return _connection
+
+
+def _close_connection():
+    """Close the cached SMTP connection, ignoring errors from a dead session."""
+    global _connection
+    connection, _connection = _connection, None
+    if connection is not None and connection.host is not None:
+        try:
+            connection.host.quit()
+        except (SMTPException, OSError):
+            pass
+
+
+@worker_process_shutdown.connect
+def _close_connection_on_shutdown(**kwargs):
+    _close_connection()
+
+
+def _send(msg):
+    """Deliver msg, reusing the process-wide SMTP session in worker processes."""
+    if not _reuse_connection:
+        mail.send(msg)
+        return
+
+    try:
+        try:
+            _get_connection().send(msg)
+        except SMTPServerDisconnected:
+            # The server dropped the idle session; reconnect once
+            _close_connection()
+            _get_connection().send(msg)
+    except (SMTPException, OSError):
+        # Drop the session so the retry starts from a fresh connection
+        _close_connection()
+        raise
+
+
+@shared_task(bind=True, ignore_result=True, max_retries=3)
+def send_email_task(self, subject, recipients, html, body):
+    """
+    Send one email.
+
+    Failures are retried with exponential backoff on a worker. Inline (eager)
+    runs happen on the request thread, so they fail immediately and leave
+    logging to the caller instead of sleeping through retries.
+
+    Args:
+        subject (str): Email subject
+        recipients (list): Recipient email addresses
+        html (str): Rendered HTML body
+        body (str): Rendered plain-text body
+    """
+    msg = Message(
+        subject=subject,
+        recipients=recipients,
+        html=html,
+        body=body
+    )
+    try:
+        _send(msg)
+    except (SMTPException, ConnectionError) as exc:
+        if self.request.is_eager:
+            raise
+        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
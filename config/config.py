@@ -64,6 +64,30 @@ class Config:
     ITEMS_PER_PAGE = 20
     MAX_ITEMS_PER_PAGE = 100
 
+    # Caching (Redis when available, disabled otherwise: an in-process cache
+    # would be invalidated in one Gunicorn worker while the others serve
+    # stale reads)
+    CACHE_REDIS_URL = os.environ.get('REDIS_URL')
+    CACHE_TYPE = 'RedisCache' if CACHE_REDIS_URL else 'NullCache'
+    CACHE_NO_NULL_WARNING = True
+    CACHE_DEFAULT_TIMEOUT = 60
+
+    # Background tasks (Celery on Redis); without a broker, tasks run inline
+    CELERY = {
+        'broker_url': CACHE_REDIS_URL,
+        'task_ignore_result': True,
+        'task_always_eager': not CACHE_REDIS_URL,
+        'task_eager_propagates': True,
+        'imports': ('app.tasks',),
+        # Run by `celery -A make_celery beat`
+        'beat_schedule': {
+            'expire-pending-bookings': {
+                'task': 'app.tasks.booking_tasks.expire_pending_bookings_task',
+                'schedule': 300.0,
+            },
+        },
+    }
+
 
 class DevelopmentConfig(Config):
     """Development environment configuration."""
@@ -94,6 +118,12 @@ class TestingConfig(Config):
     
     # Disable CSRF for testing
     WTF_CSRF_ENABLED = False
+
+    # Tests seed bookings directly, so never serve cached reads
+    CACHE_TYPE = 'NullCache'
+
+    # Run tasks inline so tests never need a broker
+    CELERY = {**Config.CELERY, 'task_always_eager': True}
     
     # Shorter token expiry for testing
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=15)
@@ -114,12 +144,16 @@ class ProductionConfig(Config):
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = 'Lax'
     
-    # Production-specific settings
+    # Production-specific settings. Each Gunicorn worker holds its own pool,
+    # so workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) must fit the database's
+    # connection limit. LIFO reuse keeps a few hot connections busy and lets
+    # idle ones age out via pool_recycle.
     SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_size': 10,
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 5)),
         'pool_timeout': 20,
-        'pool_recycle': -1,
-        'max_overflow': 0,
+        'pool_recycle': 1800,
+        'pool_use_lifo': True,
         'pool_pre_ping': True,
         'connect_args': {
             'connect_timeout': 60,
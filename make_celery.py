@@ -0,0 +1,9 @@
+"""
+WeRent Backend API - Celery worker entry point.
+Run with: celery -A make_celery worker --loglevel=info
+"""
+
+from app import create_app
+
+flask_app = create_app()
+celery_app = flask_app.extensions['celery']
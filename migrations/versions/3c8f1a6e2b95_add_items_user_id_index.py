@@ -0,0 +1,26 @@
+"""Add index on items.user_id for owner lookups
+
+Revision ID: 3c8f1a6e2b95
+Revises: 7b2e4c91d0a3
+Create Date: 2026-10-16 21:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c8f1a6e2b95'
+down_revision = '7b2e4c91d0a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('items', schema=None) as batch_op:
+        batch_op.create_index('ix_items_user_id', ['user_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('items', schema=None) as batch_op:
+        batch_op.drop_index('ix_items_user_id')
@@ -0,0 +1,26 @@
+"""Add index on items.created_at for recently-added listings
+
+Revision ID: 5e1b8c3d9a27
+Revises: 9d4a7e2c5f18
+Create Date: 2026-10-17 00:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e1b8c3d9a27'
+down_revision = '9d4a7e2c5f18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('items', schema=None) as batch_op:
+        batch_op.create_index('ix_items_created_at', ['created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('items', schema=None) as batch_op:
+        batch_op.drop_index('ix_items_created_at')
@@ -0,0 +1,26 @@
+"""Add index on items.rating for top-rated listings
+
+Revision ID: 6c3e9b1f4d72
+Revises: 5e1b8c3d9a27
+Create Date: 2026-10-17 01:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6c3e9b1f4d72'
+down_revision = '5e1b8c3d9a27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('items', schema=None) as batch_op:
+        batch_op.create_index('ix_items_rating', ['rating'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('items', schema=None) as batch_op:
+        batch_op.drop_index('ix_items_rating')
@@ -0,0 +1,28 @@
+"""Add composite indexes for booking overlap and history queries
+
+Revision ID: 7b2e4c91d0a3
+Revises: 04f23c4db7a1
+Create Date: 2026-10-16 18:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b2e4c91d0a3'
+down_revision = '04f23c4db7a1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.create_index('ix_booking_item_status_dates', ['item_id', 'status', 'start_date', 'end_date'], unique=False)
+        batch_op.create_index('ix_booking_user_created', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.drop_index('ix_booking_user_created')
+        batch_op.drop_index('ix_booking_item_status_dates')
@@ -0,0 +1,36 @@
+"""Add items.booking_count for popular listings
+
+Revision ID: 8f2d5a1c7e40
+Revises: 6c3e9b1f4d72
+Create Date: 2026-10-17 02:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8f2d5a1c7e40'
+down_revision = '6c3e9b1f4d72'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('items', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('booking_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill from the bookings already on record
+    op.execute(
+        'UPDATE items SET booking_count = '
+        '(SELECT COUNT(*) FROM bookings WHERE bookings.item_id = items.id)'
+    )
+
+    with op.batch_alter_table('items', schema=None) as batch_op:
+        batch_op.create_index('ix_items_booking_count', [sa.text('booking_count DESC')], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('items', schema=None) as batch_op:
+        batch_op.drop_index('ix_items_booking_count')
+        batch_op.drop_column('booking_count')
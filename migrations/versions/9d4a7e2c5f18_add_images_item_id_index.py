@@ -0,0 +1,26 @@
+"""Add index on images.item_id for item image lookups
+
+Revision ID: 9d4a7e2c5f18
+Revises: 3c8f1a6e2b95
+Create Date: 2026-10-16 23:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d4a7e2c5f18'
+down_revision = '3c8f1a6e2b95'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('images', schema=None) as batch_op:
+        batch_op.create_index('ix_images_item_id', ['item_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('images', schema=None) as batch_op:
+        batch_op.drop_index('ix_images_item_id')
@@ -260,6 +260,18 @@ def test_resend_verification_success(client, db, user_factory, make_auth_headers
     assert data['success']
     assert data['data']['email_sent'] is True or 'Verification email sent' in data['message']
 
+def test_resend_verification_queues_email(client, db, user_factory, make_auth_headers):
+    user = user_factory(email='queued@gmail.com', is_verified=False)
+    headers = make_auth_headers(user)
+    with patch('app.services.email_service.send_email_task.delay') as delay:
+        resp = client.post('/api/auth/resend-verification', headers=headers)
+    assert resp.status_code == 200
+    delay.assert_called_once()
+    subject, recipients, html, text = delay.call_args.args
+    assert recipients == ['queued@gmail.com']
+    assert str(user.uuid) in html and str(user.uuid) in text
+    assert f'http://localhost/api/auth/verify-email/{user.uuid}' in html
+
 def test_resend_verification_already_verified(client, db, user_factory, make_auth_headers):
     user = user_factory(email='verified@werent.com', is_verified=True)
     headers = make_auth_headers(user)
@@ -286,3 +298,56 @@ def test_refresh_token_request_body(client, db, user_factory):
     data = resp.get_json()
     assert data['success']
     assert 'access_token' in data['data']
+
+def test_send_email_task_reuses_connection(app, monkeypatch):
+    from smtplib import SMTPServerDisconnected
+    from app.extensions import mail
+    from app.tasks import email_tasks
+    monkeypatch.setattr(app.extensions['mail'], 'suppress', True)
+    # Only worker processes keep a connection open between emails
+    monkeypatch.setattr(email_tasks, '_reuse_connection', True)
+    monkeypatch.setattr(email_tasks, '_connection', None)
+
+    class _Dropped:
+        host = None
+
+        def send(self, message):
+            raise SMTPServerDisconnected('idle timeout')
+
+    with app.app_context(), mail.record_messages() as outbox:
+        email_tasks.send_email_task('One', ['a@gmail.com'], '<p>1</p>', '1')
+        connection = email_tasks._connection
+        email_tasks.send_email_task('Two', ['b@gmail.com'], '<p>2</p>', '2')
+        assert email_tasks._connection is connection
+        # A session the server dropped is replaced and the email still goes out
+        email_tasks._connection = _Dropped()
+        email_tasks.send_email_task('Three', ['c@gmail.com'], '<p>3</p>', '3')
+        assert not isinstance(email_tasks._connection, _Dropped)
+    assert [msg.subject for msg in outbox] == ['One', 'Two', 'Three']
+
+
+def test_send_email_task_inline_does_not_share_connection(app, monkeypatch):
+    from app.extensions import mail
+    from app.tasks import email_tasks
+    monkeypatch.setattr(app.extensions['mail'], 'suppress', True)
+    monkeypatch.setattr(email_tasks, '_connection', None)
+    with app.app_context(), mail.record_messages() as outbox:
+        email_tasks.send_email_task('Inline', ['a@gmail.com'], '<p>1</p>', '1')
+        assert email_tasks._connection is None
+    assert [msg.subject for msg in outbox] == ['Inline']
+
+
+def test_send_email_task_inline_fails_without_retrying(app, monkeypatch):
+    from smtplib import SMTPException
+    from app.extensions import mail
+    from app.tasks import email_tasks
+    calls = []
+
+    def _fail(message):
+        calls.append(message)
+        raise SMTPException('refused')
+
+    monkeypatch.setattr(mail, 'send', _fail)
+    with app.app_context(), pytest.raises(SMTPException):
+        email_tasks.send_email_task.delay('Inline', ['a@gmail.com'], '<p>1</p>', '1')
+    assert len(calls) == 1
@@ -6,7 +6,7 @@ Run with: pytest tests/test_booking_routes.py -v -s --cov=app.routes.booking --c
 """
 
 from datetime import datetime, timedelta
-from app.models.booking import BookingStatus
+from app.models.booking import Booking, BookingStatus
 
 
 
@@ -52,6 +52,26 @@ class TestBookingRoutes:
         assert 'All bookings retrieved successfully' in data['message']
         assert len(data['data']) == 2
 
+    def test_get_bookings_admin_paginated(self, client, db, user_factory, booking_factory, make_auth_headers, monkeypatch):
+        """Test admin booking list honours page and per_page."""
+        admin = user_factory(email='admin@test.com', is_admin=True, is_verified=True)
+        user = user_factory(email='user1@test.com', is_verified=True)
+        for _ in range(3):
+            booking_factory(user=user)
+
+        headers = make_auth_headers(admin)
+        resp = client.get('/bookings/?page=1&per_page=2', headers=headers)
+        assert resp.status_code == 200
+        assert len(resp.get_json()['data']) == 2
+
+        resp = client.get('/bookings/?page=2&per_page=2', headers=headers)
+        assert len(resp.get_json()['data']) == 1
+
+        # Without page the admin still gets one bounded page, not the whole table
+        monkeypatch.setitem(client.application.config, 'ITEMS_PER_PAGE', 2)
+        resp = client.get('/bookings/', headers=headers)
+        assert len(resp.get_json()['data']) == 2
+
     def test_get_bookings_unauthenticated(self, client):
         """Test unauthenticated access is rejected."""
         resp = client.get('/bookings/')
@@ -615,6 +635,26 @@ class TestBookingRoutes:
         assert data['success'] is True
         assert len(data['data']) == 2
 
+    def test_get_booking_history_keyset_pages(self, client, db, user_factory, booking_factory, make_auth_headers):
+        """Test before_id pages through history without repeats or gaps."""
+        user = user_factory(email='user@test.com', is_verified=True)
+        for i in range(5):
+            booking_factory(user=user)
+
+        headers = make_auth_headers(user)
+        seen = []
+        before = ''
+        while True:
+            resp = client.get(f'/bookings/history?limit=2{before}', headers=headers)
+            page = [b['id'] for b in resp.get_json()['data']]
+            if not page:
+                break
+            seen.extend(page)
+            before = f'&before_id={page[-1]}'
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
     # ===== GET /bookings/user/{user_id} - Get User's Bookings =====
     
     def test_get_bookings_by_user_own_bookings(self, client, db, user_factory, booking_factory, make_auth_headers):
@@ -741,7 +781,7 @@ class TestBookingRoutes:
         assert resp.status_code == 200
         data = resp.get_json()
         assert data['success'] is True
-        assert 'total_revenue' in data['data']
+        assert data['data']['total_revenue'] == 300.0
 
     # ===== GET /bookings/statistics - Get Booking Statistics =====
     
@@ -758,6 +798,27 @@ class TestBookingRoutes:
         data = resp.get_json()
         assert data['success'] is True
 
+    def test_get_booking_statistics_counts(self, client, db, user_factory, booking_factory, make_auth_headers):
+        """Test booking statistics aggregate counts and completed revenue per status."""
+        admin = user_factory(email='admin@test.com', is_admin=True, is_verified=True)
+        user = user_factory(email='user@test.com', is_verified=True)
+        booking_factory(user=user, status=BookingStatus.PENDING, total_price=50.0)
+        booking_factory(user=user, status=BookingStatus.COMPLETED, total_price=200.0)
+        booking_factory(user=user, status=BookingStatus.COMPLETED, total_price=100.0)
+        booking_factory(user=user, status=BookingStatus.CANCELLED, total_price=75.0)
+
+        headers = make_auth_headers(admin)
+        resp = client.get('/bookings/statistics', headers=headers)
+
+        assert resp.status_code == 200
+        stats = resp.get_json()['data']
+        assert stats['total_bookings'] == 4
+        assert stats['pending_bookings'] == 1
+        assert stats['completed_bookings'] == 2
+        assert stats['cancelled_bookings'] == 1
+        assert stats['confirmed_bookings'] == 0
+        assert stats['total_revenue'] == 300.0
+
     def test_get_booking_statistics_non_admin_forbidden(self, client, db, user_factory, make_auth_headers):
         """Test regular user cannot get booking statistics."""
         user = user_factory(email='user@test.com', is_verified=True)
@@ -1038,3 +1099,268 @@ class TestBookingBusinessLogic:
         # Should show reduced availability due to pending booking
         assert data['data']['available_quantity'] == 3  # 5 - 2 = 3
         assert data['data']['pending_reserved'] == 2
+
+    def test_booking_statistics_cache_invalidated_on_write(self, app, db, user_factory, booking_factory):
+        """Test cached statistics are served until a booking write invalidates them."""
+        from app.extensions import cache
+        from app.services.booking_service import BookingService
+        cache.init_app(app, config={'CACHE_TYPE': 'SimpleCache'})
+
+        user = user_factory(email='user@test.com', is_verified=True)
+        booking = booking_factory(user=user, status=BookingStatus.PENDING)
+        assert BookingService.get_booking_statistics()['pending_bookings'] == 1
+
+        # Seeded directly, so the cached result is still served
+        booking_factory(user=user, status=BookingStatus.PENDING)
+        assert BookingService.get_booking_statistics()['pending_bookings'] == 1
+
+        BookingService.update_booking(booking.id, status=BookingStatus.CONFIRMED)
+        stats = BookingService.get_booking_statistics()
+        assert stats['pending_bookings'] == 1
+        assert stats['confirmed_bookings'] == 1
+
+    def test_status_transitions_use_conditional_updates(self, app, db, booking_factory):
+        """Test cancel/complete only move bookings out of their allowed states."""
+        import pytest
+        from app.services.booking_service import BookingService
+        service = BookingService()
+
+        pending = booking_factory(status=BookingStatus.PENDING)
+        assert service.cancel_booking(pending.id).status == BookingStatus.CANCELLED
+
+        with pytest.raises(ValueError, match="already cancelled"):
+            service.cancel_booking(pending.id)
+
+        other = booking_factory(status=BookingStatus.PENDING)
+        with pytest.raises(ValueError, match="Only confirmed bookings"):
+            service.complete_booking(other.id)
+        assert db.session.get(type(other), other.id).status == BookingStatus.PENDING
+
+        paid = booking_factory(status=BookingStatus.PAID)
+        with pytest.raises(ValueError, match="Only pending or confirmed"):
+            service.cancel_booking(paid.id)
+        assert db.session.get(type(paid), paid.id).status == BookingStatus.PAID
+
+        assert service.cancel_booking(999999) is None
+
+    def test_confirm_booking_transition(self, app, db, booking_factory):
+        """Test confirming a PENDING booking with free dates confirms it."""
+        import pytest
+        from app.models.booking import Booking
+        from app.services.booking_service import BookingService
+        service = BookingService()
+        pending = booking_factory(status=BookingStatus.PENDING)
+
+        assert service.confirm_booking(pending.id).status == BookingStatus.CONFIRMED
+        db.session.expire_all()
+        assert db.session.get(Booking, pending.id).status == BookingStatus.CONFIRMED
+
+        with pytest.raises(ValueError, match="Only pending bookings"):
+            service.confirm_booking(pending.id)
+        assert service.confirm_booking(999999) is None
+
+    def test_confirm_booking_rolls_back_when_unavailable(self, app, db, item_factory, booking_factory):
+        """Test a confirm that fails the availability re-check leaves the booking PENDING."""
+        import pytest
+        from app.models.booking import Booking
+        from app.services.booking_service import BookingService
+        item = item_factory(quantity=1)
+        booking_factory(item=item, status=BookingStatus.CONFIRMED)
+        pending = booking_factory(item=item, status=BookingStatus.PENDING)
+
+        with pytest.raises(ValueError, match="no longer available"):
+            BookingService().confirm_booking(pending.id)
+        db.session.expire_all()
+        assert db.session.get(Booking, pending.id).status == BookingStatus.PENDING
+
+    def test_complete_booking_transition(self, app, db, booking_factory):
+        """Test completing a CONFIRMED booking completes it."""
+        from app.models.booking import Booking
+        from app.services.booking_service import BookingService
+        confirmed = booking_factory(status=BookingStatus.CONFIRMED)
+
+        assert BookingService().complete_booking(confirmed.id).status == BookingStatus.COMPLETED
+        db.session.expire_all()
+        assert db.session.get(Booking, confirmed.id).status == BookingStatus.COMPLETED
+
+    def test_cancel_confirmed_booking_transition(self, app, db, booking_factory):
+        """Test cancelling a CONFIRMED booking cancels it."""
+        from app.models.booking import Booking
+        from app.services.booking_service import BookingService
+        confirmed = booking_factory(status=BookingStatus.CONFIRMED)
+
+        assert BookingService().cancel_booking(confirmed.id).status == BookingStatus.CANCELLED
+        db.session.expire_all()
+        assert db.session.get(Booking, confirmed.id).status == BookingStatus.CANCELLED
+
+    def test_is_available_for_dates_checks_overlaps(self, app, db, item_factory, booking_factory):
+        """Test the overlap probe only blocks dates held by active bookings."""
+        from app.services.booking_service import BookingService
+        service = BookingService()
+        item = item_factory()
+        confirmed = booking_factory(item=item, status=BookingStatus.CONFIRMED)
+        start, end = confirmed.start_date, confirmed.end_date
+
+        assert service.is_available_for_dates(item.id, start, end) is False
+        assert service.is_available_for_dates(item.id, end + timedelta(days=1), end + timedelta(days=3)) is True
+        assert service.is_available_for_dates(999999, start, end) is False
+
+        booking_factory(item=item, status=BookingStatus.CANCELLED,
+                        start_date=end + timedelta(days=5), end_date=end + timedelta(days=6))
+        assert service.is_available_for_dates(item.id, end + timedelta(days=5), end + timedelta(days=6)) is True
+
+    def test_batch_rolls_back_writes_from_other_services(self, app, db, item_factory, booking_factory):
+        """Test a failure inside BookingService.batch() undoes both the booking and the item write."""
+        import pytest
+        from app.models.booking import Booking
+        from app.models.item import Item
+        from app.services import booking_service as booking_module
+        service = booking_module.BookingService()
+        item = item_factory(name='Before')
+        pending = booking_factory(item=item, status=BookingStatus.PENDING)
+
+        with pytest.raises(RuntimeError):
+            with service.batch():
+                service._transition(pending.id, [BookingStatus.PENDING], BookingStatus.CONFIRMED)
+                booking_module._item_service.update(item, name='After')
+                raise RuntimeError('boom')
+
+        db.session.expire_all()
+        assert db.session.get(Booking, pending.id).status == BookingStatus.PENDING
+        assert db.session.get(Item, item.id).name == 'Before'
+
+    def test_cancel_confirmed_booking_releases_dates(self, app, db, item_factory, booking_factory):
+        """Test cancelling a CONFIRMED booking makes its dates bookable again."""
+        from app.models.booking import Booking
+        from app.services.booking_service import BookingService
+        item = item_factory(quantity=1)
+        confirmed = booking_factory(item=item, status=BookingStatus.CONFIRMED)
+        dates = (item.id, confirmed.start_date, confirmed.end_date)
+        assert Booking.check_item_availability(*dates)['can_fulfill'] is False
+
+        BookingService().cancel_booking(confirmed.id)
+        assert Booking.check_item_availability(*dates)['can_fulfill'] is True
+
+    def test_create_booking_insert_select_guards_quantity(self, app, db, user_factory, item_factory):
+        """Test create_booking prices the booking in SQL and refuses overbooking."""
+        import pytest
+        from app.services.booking_service import BookingService
+        user = user_factory(email='user@test.com', is_verified=True)
+        item = item_factory(user=user, quantity=3)
+        start = datetime.now().date() + timedelta(days=1)
+        end = start + timedelta(days=2)
+
+        booking = BookingService.create_booking(user.id, item.id, start, end, quantity=2)
+        assert isinstance(booking, Booking)
+        assert booking.status == BookingStatus.PENDING
+        assert booking.total_price == item.price_per_day * 3 * 2
+
+        with pytest.raises(ValueError, match="Available: 1/3"):
+            BookingService.create_booking(user.id, item.id, start, end, quantity=2)
+
+        with pytest.raises(ValueError, match="Item not found"):
+            BookingService.create_booking(user.id, 999999, start, end)
+
+        unverified = user_factory(email='unverified@test.com', is_verified=False)
+        with pytest.raises(ValueError, match="Email verification is required"):
+            BookingService.create_booking(unverified.id, item.id, start, end)
+
+    def test_booking_list_loads_items_in_constant_queries(self, app, db, user_factory, booking_factory):
+        """Test listing bookings and reading item names does not issue a query per row."""
+        import pytest
+        from sqlalchemy import event
+        from sqlalchemy.exc import InvalidRequestError
+        from app.services.booking_service import BookingService
+        user = user_factory(email='user@test.com', is_verified=True)
+        for _ in range(10):
+            booking_factory(user=user)
+        db.session.expunge_all()
+
+        statements = []
+
+        def _count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', _count)
+        try:
+            bookings = BookingService.get_all_bookings()
+            names = [booking.item.name for booking in bookings]
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', _count)
+
+        assert len(names) == 10
+        assert len(statements) == 2  # bookings + one SELECT ... IN for items
+
+        # Relationships the listing does not render are never lazy-loaded
+        with pytest.raises(InvalidRequestError):
+            bookings[0].user
+
+    def test_expire_pending_bookings_cancels_only_lapsed(self, app, db, booking_factory):
+        """Test stale PENDING bookings are cancelled in bulk and others are left alone."""
+        from app.services.booking_service import BookingService
+        now = datetime.utcnow()
+        lapsed = booking_factory(status=BookingStatus.PENDING)
+        lapsed.expires_at = now - timedelta(minutes=1)
+        live = booking_factory(status=BookingStatus.PENDING)
+        live.expires_at = now + timedelta(minutes=10)
+        confirmed = booking_factory(status=BookingStatus.CONFIRMED)
+        confirmed.expires_at = now - timedelta(minutes=1)
+        db.session.commit()
+
+        assert BookingService.expire_pending_bookings() == 1
+        db.session.expire_all()
+        assert lapsed.status == BookingStatus.CANCELLED
+        assert live.status == BookingStatus.PENDING
+        assert confirmed.status == BookingStatus.CONFIRMED
+
+    def test_get_booking_checks_owner_in_one_query(self, app, db, user_factory, booking_factory):
+        """Test fetching a booking for a user checks verification and ownership in one statement."""
+        import pytest
+        from sqlalchemy import event
+        from app.services.booking_service import BookingService
+        owner = user_factory(email='owner@test.com', is_verified=True)
+        other = user_factory(email='other@test.com', is_verified=True)
+        booking_id, owner_id, other_id = booking_factory(user=owner).id, owner.id, other.id
+        db.session.expunge_all()
+
+        statements = []
+
+        def _count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', _count)
+        try:
+            assert BookingService.get_booking(booking_id, owner_id).id == booking_id
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', _count)
+
+        assert len(statements) == 1
+        with pytest.raises(ValueError, match="Access denied"):
+            BookingService.get_booking(booking_id, other_id)
+        with pytest.raises(ValueError, match="User not found"):
+            BookingService.get_booking(booking_id, 999999)
+        assert BookingService.get_booking(999999, owner_id) is None
+
+    def test_calculate_total_price_uses_loaded_item(self, app, db, item_factory):
+        """Test calculate_total_price reuses a loaded item and queries the price otherwise."""
+        from sqlalchemy import event
+        item = item_factory(price_per_day=25.0)
+        start = datetime.now().date()
+        booking = Booking(item_id=item.id, user_id=item.user_id, start_date=start,
+                          end_date=start + timedelta(days=2), quantity=1)
+
+        statements = []
+
+        def _count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', _count)
+        try:
+            assert booking.calculate_total_price() == 75.0
+            assert len(statements) == 1  # SELECT price_per_day only
+
+            booking.item = item
+            assert booking.calculate_total_price() == 75.0
+            assert len(statements) == 1
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', _count)
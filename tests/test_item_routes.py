@@ -397,6 +397,21 @@ class TestItemRoutes:
         data = resp.get_json()
         assert 'data' in data
 
+    def test_list_items_paginated(self, client, db, item_factory, monkeypatch):
+        items = [item_factory(name=f'Item {n}') for n in range(3)]
+        resp = client.get('/items', query_string={'page': 2, 'per_page': 2})
+        assert resp.status_code == 200
+        assert [item['id'] for item in resp.get_json()['data']] == [items[2].id]
+        resp = client.get('/items')
+        assert len(resp.get_json()['data']) == 3
+        # Without page the first page is served; per_page is capped
+        monkeypatch.setitem(client.application.config, 'ITEMS_PER_PAGE', 2)
+        monkeypatch.setitem(client.application.config, 'MAX_ITEMS_PER_PAGE', 2)
+        resp = client.get('/items')
+        assert [item['id'] for item in resp.get_json()['data']] == [items[0].id, items[1].id]
+        resp = client.get('/items', query_string={'per_page': 1000})
+        assert len(resp.get_json()['data']) == 2
+
     def test_create_item_admin(self, client, admin_token):
         item_data = {
             'name': 'Test Camera',
@@ -602,3 +617,124 @@ class TestItemRoutes:
             headers={'Authorization': f'Bearer {user_token}'}
         )
         assert resp.status_code == 403
+
+    def test_popular_and_recent_items_cached(self, app, db, user_factory, item_factory):
+        """Listings are cached as ID lists; a new item refreshes the recent list."""
+        from app.extensions import cache
+        from app.models.item import Gender, ItemType, Size
+        from app.services.item_service import ItemService
+        cache.init_app(app, config={'CACHE_TYPE': 'SimpleCache'})
+        service = ItemService()
+
+        from datetime import date, timedelta
+        from app.services.booking_service import BookingService
+        owner = user_factory()
+        renter = user_factory(is_verified=True)
+        quiet = item_factory(user=owner, name='Quiet')
+        busy = item_factory(user=owner, name='Busy')
+        start = date.today() + timedelta(days=10)
+
+        def _book(item, offset):
+            day = start + timedelta(days=offset)
+            BookingService.create_booking(renter.id, item.id, day, day + timedelta(days=1))
+
+        _book(busy, 0)
+        _book(busy, 5)
+        _book(quiet, 0)
+
+        popular = service.get_popular_items()
+        assert [item.name for item in popular] == ['Busy', 'Quiet']
+        # Images were loaded with the listing, not lazily per item
+        assert all('images' in item.__dict__ for item in popular)
+        assert len(service.get_recently_added_items()) == 2
+
+        service.create_item(
+            name='Fresh', type=ItemType.DRESS, size=Size.M, gender=Gender.UNISEX, brand=None, color=None,
+            quantity=1, product_code='FRESH1', description='New', price_per_day=5.0, user_id=owner.id
+        )
+        fresh = service.get_recently_added_items()[0]
+        assert fresh.name == 'Fresh'
+
+        # Updates and deletes refresh the listings too
+        service.update_item(fresh.id, name='Renamed')
+        assert service.get_recently_added_items()[0].name == 'Renamed'
+        assert service.delete_item(fresh.id) is not None
+        assert len(service.get_recently_added_items()) == 2
+
+        # New bookings bump items.booking_count and refresh the popular list
+        _book(quiet, 5)
+        _book(quiet, 10)
+        assert [item.name for item in service.get_popular_items()] == ['Quiet', 'Busy']
+
+    def test_top_rated_items_use_item_rating(self, app, db, user_factory, item_factory):
+        """Top-rated listing orders by the rating ReviewService keeps on items."""
+        from app.extensions import cache
+        from app.services.item_service import ItemService
+        from app.services.review_service import ReviewService
+        cache.init_app(app, config={'CACHE_TYPE': 'SimpleCache'})
+
+        owner = user_factory()
+        reviewer = user_factory()
+        good = item_factory(user=owner, name='Good')
+        great = item_factory(user=owner, name='Great')
+        item_factory(user=owner, name='Unreviewed')
+        ReviewService().create_review(good.id, reviewer.id, 3, 'Fine')
+        review = ReviewService().create_review(great.id, reviewer.id, 5, 'Lovely')
+
+        top = ItemService().get_top_rated_items()
+        assert [item.name for item in top] == ['Great', 'Good']
+
+        # Rating changes refresh the cached listing
+        ReviewService().update_review(review.id, reviewer.id, rating=1)
+        top = ItemService().get_top_rated_items()
+        assert [item.name for item in top] == ['Good', 'Great']
+
+    def test_get_item_stats(self, app, db, user_factory, item_factory, booking_factory):
+        """Item stats count bookings, reviews and images in one query."""
+        from app.models.image import Image
+        from app.services.item_service import ItemService
+        from app.services.review_service import ReviewService
+
+        owner = user_factory()
+        item = item_factory(user=owner)
+        booking_factory(item=item)
+        booking_factory(item=item)
+        ReviewService().create_review(item.id, user_factory().id, 4, 'Good')
+        ReviewService().create_review(item.id, user_factory().id, 5, 'Great')
+        db.session.add(Image(image_base64='aGVsbG8=', item_id=item.id))
+        db.session.commit()
+
+        stats = ItemService().get_item_stats(item.id)
+        assert stats == {
+            'total_bookings': 2,
+            'total_reviews': 2,
+            'average_rating': 4.5,
+            'total_images': 1,
+            'created_at': item.created_at.isoformat(),
+        }
+        assert ItemService().get_item_stats(999999) is None
+
+    def test_image_owner_checks(self, app, db, user_factory, item_factory):
+        """Owner-checked image edits load the image and its item's owner together."""
+        import pytest
+        from app.models.image import Image
+        from app.services.image_service import ImageService
+
+        owner = user_factory()
+        stranger = user_factory()
+        item = item_factory(user=owner)
+        image = Image(image_base64='aGVsbG8=', item_id=item.id)
+        db.session.add(image)
+        db.session.commit()
+        service = ImageService()
+
+        assert service._get_image_and_owner(image.id) == (image, owner.id)
+        assert service.delete_image(999999, owner.id) is None
+        assert service.set_primary_image(999999, owner.id) is None
+        assert service.update_image_url(999999, 'https://example.com/a.png', owner.id) is None
+        with pytest.raises(ValueError, match="your own items"):
+            service.delete_image(image.id, stranger.id)
+        with pytest.raises(ValueError, match="your own items"):
+            service.set_primary_image(image.id, stranger.id)
+        with pytest.raises(ValueError, match="your own items"):
+            service.update_image_url(image.id, 'https://example.com/a.png', stranger.id)
@@ -207,3 +207,47 @@ class TestPaymentRoutes:
         headers = make_auth_headers(other)
         response = client.get(f"/payments/user/{owner.id}", headers=headers)
         assert response.status_code == 401 or response.status_code == 403
+
+    def test_create_payment_service_marks_bookings_paid(self, app, db, user_factory, booking_factory):
+        from sqlalchemy import event
+        from app.extensions import cache
+        from app.models.booking import Booking, BookingStatus
+        from app.models.payment import PaymentMethod, PaymentType
+        from app.services.booking_service import BookingService
+        from app.services.payment_service import PaymentService
+        cache.init_app(app, config={'CACHE_TYPE': 'SimpleCache'})
+
+        user = user_factory(is_verified=True)
+        other = user_factory(is_verified=True)
+        first = booking_factory(user=user, status=BookingStatus.PENDING, is_paid=False)
+        second = booking_factory(user=user, item=first.item, status=BookingStatus.PENDING, is_paid=False)
+        foreign = booking_factory(user=other, status=BookingStatus.PENDING, is_paid=False)
+        item_id, ids = first.item_id, [first.id, second.id]
+
+        # Someone else's booking or an unknown ID rejects the whole payment
+        assert PaymentService.create_payment(ids + [foreign.id], 10.0, PaymentMethod.CC, PaymentType.RENT, user.id) is None
+        assert PaymentService.create_payment(ids + [999999], 10.0, PaymentMethod.CC, PaymentType.RENT, user.id) is None
+
+        # Warm the cached per-item listing before paying
+        assert {b['status'] for b in BookingService.get_bookings_by_item(item_id)} == {BookingStatus.PENDING}
+
+        statements = []
+
+        def _count(conn, cursor, statement, *args):
+            if 'FROM bookings' in statement:
+                statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', _count)
+        try:
+            payment = PaymentService.create_payment(ids, 10.0, PaymentMethod.CC, PaymentType.RENT, user.id)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', _count)
+
+        assert payment is not None
+        assert len(statements) == 1  # every booking loaded with one IN query
+        db.session.expire_all()
+        assert all(db.session.get(Booking, i).status == BookingStatus.PAID for i in ids)
+        assert all(db.session.get(Booking, i).is_paid for i in ids)
+        assert db.session.get(Booking, foreign.id).status == BookingStatus.PENDING
+        # The cached listing was invalidated, not left showing PENDING
+        assert {b['status'] for b in BookingService.get_bookings_by_item(item_id)} == {BookingStatus.PAID}
@@ -1,6 +1,7 @@
 import pytest
 from app.models.user import User
 from app.models.review import Review
+from app.models.image import Image
 
 # pytest tests/test_review_routes.py -v -s --cov=. --cov-report term-missing
 
@@ -82,6 +83,7 @@ def test_update_review_success(client, db, item_with_owner, another_user, review
     assert data["review_message"] == "Updated review!"
     assert isinstance(data["images"], list)
     assert len(data["images"]) == 1
+    assert Image.query.filter_by(review_id=review_id).count() == 1
 
     # Unauthorized user tries to update
     other = User(email="other@example.com", first_name="Other", last_name="User", phone_number="08123456789")
@@ -121,6 +123,7 @@ def test_delete_review_success(client, db, item_with_owner, another_user, review
     # Verify deleted
     resp3 = client.get(f"/items/{item.id}/reviews")
     assert all(r["id"] != review_id for r in resp3.get_json()["data"])
+    assert Image.query.filter_by(review_id=review_id).count() == 0
 
     # Unauthorized user tries to delete
     other = User(email="other@example.com", first_name="Other", last_name="User", phone_number="08123456789")
@@ -158,6 +161,30 @@ def test_review_statistics_service(db, item_with_owner, another_user, review_pay
     stats2 = service.get_review_statistics(item_id=item.id)
     assert stats2["total_reviews"] == 1
     assert stats2["average_rating"] == 5.0
+    assert item.rating == 5.0
+    assert stats2["min_rating"] == stats2["max_rating"] == 5
+    assert stats2["rating_distribution"] == {"1_star": 0, "2_star": 0, "3_star": 0, "4_star": 0, "5_star": 1}
+    # Rating follows updates and deletes in the same commit as the review
+    review = service.get_user_review_for_item(user.id, item.id)
+    service.update_review(review.id, user.id, rating=3)
+    assert item.rating == 3.0
+    service.delete_review(review.id, user.id)
+    assert item.rating == 0.0
+
+
+def test_item_service_calculate_item_rating(db, item_with_owner, another_user, user_factory):
+    from app.services.item_service import ItemService
+    item, _ = item_with_owner
+    service = ItemService()
+    assert service.calculate_item_rating(item.id) == 0.0
+    db.session.add_all([
+        Review(item_id=item.id, user_id=another_user.id, rating=5, review_message="Great", images=[]),
+        Review(item_id=item.id, user_id=user_factory().id, rating=4, review_message="Good", images=[]),
+        Review(item_id=item.id, user_id=user_factory().id, rating=4, review_message="Fine", images=[]),
+    ])
+    db.session.commit()
+    assert service.calculate_item_rating(item.id) == 4.33
+    assert service.calculate_item_rating(999999) == 0.0
 
 
 def test_review_model_to_dict(db, item_with_owner, another_user):
@@ -204,12 +231,33 @@ def test_review_service_invalid_rating(db, item_with_owner, another_user):
         service.create_review(item.id, user.id, 6, "Too high", images=None)
 
 
-def test_review_service_can_user_review_item(db, item_with_owner, another_user):
+def test_review_service_missing_item_or_user(db, item_with_owner, another_user):
+    from app.services.review_service import ReviewService
+    item, _ = item_with_owner
+    service = ReviewService()
+    with pytest.raises(ValueError, match="Item not found"):
+        service.create_review(item.id + 999, another_user.id, 5, "Missing item", images=None)
+    with pytest.raises(ValueError, match="User not found"):
+        service.create_review(item.id, another_user.id + 999, 5, "Missing user", images=None)
+
+
+def test_review_service_can_user_review_item(db, item_with_owner, another_user, booking_factory):
     from app.services.review_service import ReviewService
+    from app.models.booking import BookingStatus
     item, _ = item_with_owner
     user = another_user
     service = ReviewService()
     # Should be False if no booking
     allowed, msg = service.can_user_review_item(user.id, item.id)
     assert allowed is False
-    # (Assumes booking model/factory exists for a true case)
+    # True once the user has a completed booking for the item
+    booking_factory(user=user, item=item, status=BookingStatus.COMPLETED)
+    allowed, msg = service.can_user_review_item(user.id, item.id)
+    assert allowed is True
+    assert service.has_user_reviewed_item(user.id, item.id) is False
+    # False again once the user has reviewed it
+    service.create_review(item.id, user.id, 4, "Rented it", images=None)
+    assert service.has_user_reviewed_item(user.id, item.id) is True
+    allowed, msg = service.can_user_review_item(user.id, item.id)
+    assert allowed is False
+    assert msg == "You have already reviewed this item"
@@ -98,3 +98,60 @@ def test_update_profile_image_validation(service, user):
     updated = service.update_profile(user.id, profile_image=None)
     assert updated is not None
     assert updated.profile_image is None
+
+
+def test_batch_commits_once(service, user):
+    with service.batch():
+        service.update(user, first_name='Batched')
+        service.update(user, last_name='Commit')
+    db_ext.session.rollback()  # the batch already committed, nothing to undo
+    assert service.get_by_id(user.id).first_name == 'Batched'
+    assert service.get_by_id(user.id).last_name == 'Commit'
+
+def test_batch_rolls_back_on_error(service, user):
+    with pytest.raises(RuntimeError):
+        with service.batch():
+            service.update(user, first_name='Discarded')
+            raise RuntimeError('boom')
+    assert service.get_by_id(user.id).first_name == 'Service'
+
+def test_batch_spans_service_instances(service, user):
+    other_service = UserService()
+    with pytest.raises(RuntimeError):
+        with service.batch():
+            # A different service instance inside the batch must not commit
+            other_service.update(user, first_name='Discarded')
+            raise RuntimeError('boom')
+    assert service.get_by_id(user.id).first_name == 'Service'
+
+def test_bulk_create(service, db):
+    users = service.bulk_create([
+        {'email': 'bulk1@werent.com', 'first_name': 'Bulk', 'last_name': 'One', 'password_hash': 'x'},
+        {'email': 'bulk2@werent.com', 'first_name': 'Bulk', 'last_name': 'Two', 'password_hash': 'x'},
+    ])
+    assert all(u.id is not None for u in users)
+
+def test_get_many_by_ids(service, user):
+    other = service.create_user('many@werent.com', 'ManyPass123', 'Many', 'User')
+    found = service.get_many_by_ids([user.id, other.id, 999999])
+    assert {u.id for u in found} == {user.id, other.id}
+    assert service.get_many_by_ids([]) == []
+
+def test_get_all_and_iter_all(service, user):
+    other = service.create_user('iter@werent.com', 'IterPass123', 'Iter', 'User')
+    assert {u.id for u in service.get_all()} == {user.id, other.id}
+    assert [u.id for u in service.get_all(limit=1)] == [min(user.id, other.id)]
+    assert [u.id for u in service.get_all(limit=1, offset=1)] == [max(user.id, other.id)]
+    assert {u.id for u in service.iter_all(chunk_size=1)} == {user.id, other.id}
+
+def test_update_accepts_property_setters(service, user, monkeypatch):
+    from app.services.base_service import BaseService
+
+    def _set_display_name(self, value):
+        self.first_name, self.last_name = value.split(' ', 1)
+
+    monkeypatch.setattr(User, 'display_name', property(None, _set_display_name), raising=False)
+    monkeypatch.setattr(BaseService, '_allowed_attrs', {})
+    updated = service.update(user, display_name='New Name', unknown='ignored')
+    assert (updated.first_name, updated.last_name) == ('New', 'Name')
+    assert not hasattr(updated, 'unknown')